@@ -1,7 +1,8 @@
 """Data access layer for Social Compass application."""
 from .accounts import AccountsRepository
 from .groups import GroupsRepository
+from .meeting_results import MeetingResultsRepository
 from .credentials import CredentialsManager
 
-__all__ = ['AccountsRepository', 'GroupsRepository', 'CredentialsManager']
+__all__ = ['AccountsRepository', 'GroupsRepository', 'MeetingResultsRepository', 'CredentialsManager']
 
@@ -1,40 +1,65 @@
 """Account data repository."""
-import json
 from typing import Dict, Optional
+from . import events
+from .storage import DEFAULT_DB_PATH, DocumentTable
 
 
 class AccountsRepository:
-    """Repository for managing account data."""
+    """Repository for managing account data, stored one row per account."""
     
-    def __init__(self, file_path: str = "accounts.json"):
+    def __init__(self, file_path: str = "accounts.json", db_path: str = DEFAULT_DB_PATH):
         self.file_path = file_path
+        self.table = DocumentTable("accounts", "email", db_path)
+        # Accounts from the legacy JSON file are imported on first use
+        self.table.import_json(file_path)
     
     def load_all(self) -> Dict:
-        """Load all accounts from JSON file."""
-        try:
-            with open(self.file_path, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+        """Load all accounts."""
+        return self.table.load_all()
     
     def save_all(self, accounts: Dict) -> None:
-        """Save all accounts to JSON file."""
-        with open(self.file_path, "w") as f:
-            json.dump(accounts, f, indent=2)
+        """Replace all accounts."""
+        self.table.replace_all(accounts)
     
     def get(self, email: str) -> Optional[Dict]:
         """Get account by email."""
-        accounts = self.load_all()
-        return accounts.get(email)
+        return self.table.get(email)
+    
+    def get_many(self, emails) -> Dict:
+        """Get the accounts for several emails; unknown emails are left out."""
+        return self.table.get_many(emails)
     
     def save(self, email: str, account_data: Dict) -> None:
         """Save or update an account."""
-        accounts = self.load_all()
-        accounts[email] = account_data
-        self.save_all(accounts)
+        self.table.put(email, account_data)
+    
+    def update(self, email: str, changes: Dict) -> Dict:
+        """Set some fields of an account without overwriting concurrent edits to others."""
+        return self.table.update(email, lambda account: {**(account or {}), **changes})
     
     def exists(self, email: str) -> bool:
         """Check if account exists."""
-        accounts = self.load_all()
-        return email in accounts
-
+        return self.table.exists(email)
+    
+    def count(self) -> int:
+        """Number of accounts."""
+        return self.table.count()
+    
+    def update_location(self, email: str, address: str, lat: Optional[float],
+                        lng: Optional[float]) -> None:
+        """Update an account's address and coordinates and notify listeners."""
+        moved = False
+        
+        def relocate(account: Optional[Dict]) -> Dict:
+            nonlocal moved
+            account = account or {}
+            moved = (account.get("lat"), account.get("lng")) != (lat, lng)
+            account["address"] = address
+            if lat is not None and lng is not None:
+                account["lat"] = lat
+                account["lng"] = lng
+            return account
+        
+        self.table.update(email, relocate)
+        if moved and lat is not None and lng is not None:
+            events.emit(events.ACCOUNT_LOCATION_CHANGED, email=email)
@@ -1,6 +1,6 @@
 """Credentials management."""
 import json
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 class CredentialsManager:
@@ -27,6 +27,19 @@ class CredentialsManager:
         """Get LatLong API key."""
         return self.get("latlong_api_key")
     
+    def get_latlong_api_keys(self) -> List[str]:
+        """Get every configured LatLong API key, 'latlong_api_keys' first."""
+        keys = list(self.get("latlong_api_keys", []))
+        single = self.get_latlong_api_key()
+        if single and single not in keys:
+            keys.append(single)
+        return [key for key in keys if key and key != "YOUR_LATLONG_API_KEY_HERE"]
+    
+    def get_latlong_daily_quota(self) -> Optional[int]:
+        """Get the per-key daily LatLong request quota, if configured."""
+        quota = self.get("latlong_daily_quota")
+        return int(quota) if quota else None
+    
     def get_google_client_id(self) -> Optional[str]:
         """Get Google OAuth client ID."""
         return self.get("client_id")
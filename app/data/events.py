@@ -0,0 +1,24 @@
+"""Change notifications emitted by the repositories."""
+from typing import Callable, Dict, List
+
+# Event names
+GROUP_CHANGED = "group_changed"                        # payload: group_name
+ACCOUNT_LOCATION_CHANGED = "account_location_changed"  # payload: email
+
+_listeners: Dict[str, List[Callable]] = {}
+
+
+def subscribe(event: str, callback: Callable) -> None:
+    """Register a callback for an event. Registering the same callback twice is a no-op."""
+    callbacks = _listeners.setdefault(event, [])
+    if callback not in callbacks:
+        callbacks.append(callback)
+
+
+def emit(event: str, **payload) -> None:
+    """Call every listener for an event. A failing listener never breaks the write."""
+    for callback in list(_listeners.get(event, [])):
+        try:
+            callback(**payload)
+        except Exception as e:
+            print(f"⚠️ Listener for '{event}' failed: {e}")
@@ -0,0 +1,92 @@
+"""Cross-process locking, atomic replacement and a parsed-content cache for file-backed stores."""
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Tuple, Union
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows: fall back to locking within this process only
+    FCNTL_AVAILABLE = False
+    fcntl = None
+
+_thread_locks: Dict[str, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+# Parsed file contents shared across the process: path -> ((mtime_ns, size), value)
+_parsed: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_parsed_lock = threading.Lock()
+
+
+def cached_load(path: str, load: Callable[[], Any]) -> Any:
+    """
+    load() the file at path once per change. The parsed value is kept for the
+    whole process and revalidated with a stat of the file's mtime and size, so
+    unchanged files cost a dict lookup. Callers must not mutate the value.
+    """
+    try:
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = None  # Missing files are not cached
+    cached = _parsed.get(path)
+    if stamp is not None and cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = load()
+    if stamp is not None:
+        with _parsed_lock:
+            _parsed[path] = (stamp, value)
+    return value
+
+
+def invalidate_file(path: str) -> None:
+    """Forget the parsed contents of path, e.g. after writing it."""
+    with _parsed_lock:
+        _parsed.pop(path, None)
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock on path for a read-modify-write cycle.
+
+    The lock lives on a sibling '<path>.lock' file, so it also covers the
+    rename done by atomic_write. Other processes and threads block until it
+    is released.
+    """
+    if not FCNTL_AVAILABLE:
+        with _thread_locks_guard:
+            lock = _thread_locks.setdefault(os.path.abspath(path), threading.Lock())
+        with lock:
+            yield
+        return
+
+    with open(f"{path}.lock", "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write(path: str, data: Union[str, bytes]) -> None:
+    """
+    Replace path with data in one step: write a temp file in the same
+    directory, fsync it and rename it over path. Readers see either the old
+    or the new file, never a truncated one.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.")
+    try:
+        with os.fdopen(fd, "wb" if isinstance(data, bytes) else "w") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        invalidate_file(path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -1,96 +1,233 @@
 """Group data repository."""
 import json
-from typing import Dict, List, Optional
+import sqlite3
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
+from . import events
+from .storage import DEFAULT_DB_PATH, DELETE, DocumentTable, has_search_index, run_migration
+
+# Most groups a search returns
+SEARCH_LIMIT = 50
+
+# Name matches outrank vibe matches in search results
+SEARCH_WEIGHTS = (10.0, 1.0)
+
+
+def _index_members(conn: sqlite3.Connection, group_name: str, members: Iterable[str]) -> None:
+    """Point the membership index at exactly these members of a group."""
+    conn.execute("DELETE FROM group_members WHERE group_name = ?", (group_name,))
+    conn.executemany("INSERT OR IGNORE INTO group_members (email, group_name) VALUES (?, ?)",
+                     [(email, group_name) for email in members])
+
+
+def _rebuild_membership_index(conn: sqlite3.Connection) -> None:
+    """Rebuild the whole email -> group index from the stored groups."""
+    conn.execute("DELETE FROM group_members")
+    for name, data in conn.execute("SELECT name, data FROM groups").fetchall():
+        _index_members(conn, name, json.loads(data).get("members", []))
+
+
+def _assign_search_id(conn: sqlite3.Connection, group_name: str) -> None:
+    """Give a group the next free search_id unless it has one."""
+    conn.execute("UPDATE groups SET search_id = (SELECT COALESCE(MAX(search_id), 0) + 1 FROM groups) "
+                 "WHERE name = ? AND search_id IS NULL", (group_name,))
+
+
+def _index_search(conn: sqlite3.Connection, group_name: str, vibe: Optional[str] = None,
+                  remove: bool = False) -> None:
+    """
+    Refresh a group's entry in the trigram search index, keyed by the group
+    row's search_id. With remove=True the entry is only dropped; call that
+    before deleting the group row. Without the index only the id is assigned.
+    """
+    if not has_search_index():
+        if not remove:
+            _assign_search_id(conn, group_name)
+        return
+    conn.execute("DELETE FROM groups_search WHERE rowid = (SELECT search_id FROM groups WHERE name = ?)",
+                 (group_name,))
+    if not remove:
+        _assign_search_id(conn, group_name)
+        conn.execute("INSERT INTO groups_search (rowid, name, vibe) "
+                     "SELECT search_id, name, ? FROM groups WHERE name = ?", (vibe, group_name))
+
+
+def _rebuild_search_index(conn: sqlite3.Connection) -> None:
+    """Rebuild the whole search index from the stored groups, numbering new ones oldest first."""
+    for (name,) in conn.execute("SELECT name FROM groups WHERE search_id IS NULL ORDER BY rowid").fetchall():
+        _assign_search_id(conn, name)
+    if not has_search_index():
+        return
+    conn.execute("DELETE FROM groups_search")
+    conn.execute("INSERT INTO groups_search (rowid, name, vibe) "
+                 "SELECT search_id, name, json_extract(data, '$.vibe') FROM groups")
+
+
+def _like_pattern(query: str) -> str:
+    """Substring LIKE pattern for query, with LIKE wildcards escaped."""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
 
 
 class GroupsRepository:
-    """Repository for managing group data."""
+    """
+    Repository for managing group data, stored one row per group.
+    
+    Memberships are mirrored in an email -> group index and names and vibes in
+    a trigram full-text index. Every write updates both in the same transaction,
+    so get_user_groups and search never scan all groups. Where SQLite has no
+    trigram tokenizer the search index is skipped and search scans instead.
+    """
     
-    def __init__(self, file_path: str = "groups.json"):
+    def __init__(self, file_path: str = "groups.json", db_path: str = DEFAULT_DB_PATH):
         self.file_path = file_path
+        self.table = DocumentTable("groups", "name", db_path)
+        # Groups from the legacy JSON file are imported on first use
+        imported = self.table.import_json(file_path)
+        for source, rebuild in (("group_members", _rebuild_membership_index),
+                                ("groups_search_ids", _rebuild_search_index)):
+            if not run_migration(source, rebuild, db_path) and imported:
+                with self.table.conn as conn:
+                    rebuild(conn)
+        if not has_search_index():
+            # Writes from here on bypass the index, so a build that has it rebuilds it
+            with self.table.conn as conn:
+                conn.execute("DELETE FROM migrations WHERE source = 'groups_search_ids'")
     
     def load_all(self) -> Dict:
-        """Load all groups from JSON file."""
-        try:
-            with open(self.file_path, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+        """Load all groups."""
+        return self.table.load_all()
     
     def save_all(self, groups: Dict) -> None:
-        """Save all groups to JSON file."""
-        with open(self.file_path, "w") as f:
-            json.dump(groups, f, indent=2)
+        """Replace all groups."""
+        with self.table.conn as conn:
+            self.table.replace_all(groups, conn)
+            _rebuild_membership_index(conn)
+            _rebuild_search_index(conn)
     
     def get(self, group_name: str) -> Optional[Dict]:
         """Get group by name."""
-        groups = self.load_all()
-        return groups.get(group_name)
+        return self.table.get(group_name)
     
     def create(self, group_name: str, members: List[str], vibe: str, 
-               created_by: str) -> None:
-        """Create a new group."""
-        groups = self.load_all()
-        groups[group_name] = {
-            "members": members,
-            "vibe": vibe,
-            "created_by": created_by,
-            "created_at": datetime.now().isoformat()
-        }
-        self.save_all(groups)
+               created_by: str) -> bool:
+        """Create a new group. Returns False if the name was taken (even concurrently)."""
+        with self.table.conn as conn:
+            created = self.table.insert(group_name, {
+                "members": members,
+                "vibe": vibe,
+                "created_by": created_by,
+                "created_at": datetime.now().isoformat()
+            }, conn)
+            if created:
+                _index_members(conn, group_name, members)
+                _index_search(conn, group_name, vibe)
+        if created:
+            events.emit(events.GROUP_CHANGED, group_name=group_name)
+        return created
     
     def add_member(self, group_name: str, member_email: str) -> None:
         """Add a member to a group."""
-        groups = self.load_all()
-        if group_name in groups:
-            if member_email not in groups[group_name].get("members", []):
-                groups[group_name]["members"].append(member_email)
-                self.save_all(groups)
+        def add(group: Optional[Dict]) -> Optional[Dict]:
+            if group is None or member_email in group.get("members", []):
+                return None
+            group.setdefault("members", []).append(member_email)
+            return group
+        
+        def index(conn: sqlite3.Connection, group: Dict) -> None:
+            conn.execute("INSERT OR IGNORE INTO group_members (email, group_name) VALUES (?, ?)",
+                         (member_email, group_name))
+        
+        if self.table.update(group_name, add, on_write=index) is not None:
+            events.emit(events.GROUP_CHANGED, group_name=group_name)
     
     def get_user_groups(self, user_email: str) -> Dict:
         """Get all groups that a user is a member of."""
-        groups = self.load_all()
-        return {
-            name: data for name, data in groups.items()
-            if user_email in data.get("members", [])
-        }
+        rows = self.table.conn.execute(
+            "SELECT g.name, g.data FROM group_members m JOIN groups g ON g.name = m.group_name "
+            "WHERE m.email = ? ORDER BY g.rowid",
+            (user_email,)
+        )
+        return {name: json.loads(data) for name, data in rows}
     
     def exists(self, group_name: str) -> bool:
         """Check if group exists."""
-        groups = self.load_all()
-        return group_name in groups
+        return self.table.exists(group_name)
     
     def remove_member(self, group_name: str, member_email: str) -> bool:
         """Remove a member from a group. Returns True if successful."""
-        groups = self.load_all()
-        if group_name in groups:
-            members = groups[group_name].get("members", [])
-            if member_email in members:
-                members.remove(member_email)
-                groups[group_name]["members"] = members
-                # If no members left, delete the group
-                if not members:
-                    del groups[group_name]
-                self.save_all(groups)
-                return True
-        return False
+        def remove(group: Optional[Dict]):
+            if group is None or member_email not in group.get("members", []):
+                return None
+            group["members"].remove(member_email)
+            # If no members left, delete the group
+            return group if group["members"] else DELETE
+        
+        def index(conn: sqlite3.Connection, group) -> None:
+            if group is DELETE:
+                _index_search(conn, group_name, remove=True)
+            conn.execute("DELETE FROM group_members WHERE email = ? AND group_name = ?",
+                         (member_email, group_name))
+        
+        if self.table.update(group_name, remove, on_write=index) is None:
+            return False
+        events.emit(events.GROUP_CHANGED, group_name=group_name)
+        return True
     
     def delete(self, group_name: str) -> bool:
         """Delete a group. Returns True if successful."""
-        groups = self.load_all()
-        if group_name in groups:
-            del groups[group_name]
-            self.save_all(groups)
+        with self.table.conn as conn:
+            _index_search(conn, group_name, remove=True)
+            deleted = self.table.delete(group_name, conn)
+            conn.execute("DELETE FROM group_members WHERE group_name = ?", (group_name,))
+        if deleted:
+            events.emit(events.GROUP_CHANGED, group_name=group_name)
             return True
         return False
     
-    def search(self, query: str) -> Dict:
-        """Search groups by name or vibe."""
-        groups = self.load_all()
-        query_lower = query.lower()
-        return {
-            name: data for name, data in groups.items()
-            if query_lower in name.lower() or query_lower in data.get("vibe", "").lower()
-        }
-
+    def search(self, query: str, limit: int = SEARCH_LIMIT,
+               member_email: Optional[str] = None,
+               exclude_member: Optional[str] = None) -> Dict:
+        """
+        Search groups by name or vibe (case-insensitive substring), best matches first.
+        
+        Queries of three or more characters use the trigram index and are ranked
+        by bm25 with name matches weighted above vibe matches; shorter queries,
+        and every query where SQLite lacks the index, fall back to a LIKE scan
+        with name matches first. An empty query lists groups oldest first.
+        member_email keeps only that user's groups, exclude_member drops them.
+        """
+        query = query.strip()
+        indexed = has_search_index()
+        if indexed:
+            source, name, vibe = ("groups_search s JOIN groups g ON g.search_id = s.rowid",
+                                  "s.name", "s.vibe")
+        else:
+            source, name, vibe = "groups g", "g.name", "json_extract(g.data, '$.vibe')"
+        conditions, params = [], []
+        if indexed and len(query) >= 3:
+            conditions.append("groups_search MATCH ?")
+            params.append('"' + query.replace('"', '""') + '"')
+            order = "bm25(groups_search, ?, ?)"
+            order_params = list(SEARCH_WEIGHTS)
+        elif query:
+            conditions.append(f"({name} LIKE ? ESCAPE '\\' OR {vibe} LIKE ? ESCAPE '\\')")
+            params += [_like_pattern(query)] * 2
+            order = f"({name} LIKE ? ESCAPE '\\') DESC, g.search_id"
+            order_params = [_like_pattern(query)]
+        else:
+            order = "g.search_id"
+            order_params = []
+        if member_email is not None:
+            conditions.append("g.name IN (SELECT group_name FROM group_members WHERE email = ?)")
+            params.append(member_email)
+        if exclude_member is not None:
+            conditions.append("g.name NOT IN (SELECT group_name FROM group_members WHERE email = ?)")
+            params.append(exclude_member)
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.table.conn.execute(
+            f"SELECT g.name, g.data FROM {source} {where} ORDER BY {order} LIMIT ?",
+            params + order_params + [limit]
+        )
+        return {name: json.loads(data) for name, data in rows}
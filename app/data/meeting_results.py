@@ -0,0 +1,78 @@
+"""Meeting result repository shared by every session and member of a group."""
+import pickle
+from typing import Any, Dict, Optional
+from . import events
+from .file_store import atomic_write, cached_load, file_lock
+from .groups import GroupsRepository
+
+
+class MeetingResultsRepository:
+    """
+    Repository for the latest meeting result of each group.
+
+    A result is stored with the member-location hash it was computed for and
+    only returned for that same hash, so a group whose members or locations
+    changed never gets a stale point. Change events also drop the entry, see
+    register_invalidation_hooks.
+    """
+
+    def __init__(self, file_path: str = "meeting_results.pkl"):
+        self.file_path = file_path
+
+    def load_all(self) -> Dict[str, Dict]:
+        """
+        Load all stored results: group name -> {'member_hash', 'result'}.
+        The file is only unpickled again after it changed; treat the dict as read-only.
+        """
+        return cached_load(self.file_path, self._read)
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.file_path, "rb") as f:
+                return pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return {}
+
+    def save_all(self, results: Dict[str, Dict]) -> None:
+        """Save all results, replacing the file in one step."""
+        atomic_write(self.file_path, pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def get(self, group_name: str, member_hash: str) -> Optional[Any]:
+        """Get the group's result if it was computed for this member-location hash."""
+        entry = self.load_all().get(group_name)
+        if entry is None or entry.get("member_hash") != member_hash:
+            return None
+        return entry.get("result")
+
+    def save(self, group_name: str, member_hash: str, result: Any) -> None:
+        """Store the group's result, replacing any result for an older member set."""
+        with file_lock(self.file_path):
+            results = dict(self.load_all())
+            results[group_name] = {"member_hash": member_hash, "result": result}
+            self.save_all(results)
+
+    def delete(self, group_name: str) -> bool:
+        """Drop the group's result. Returns True if one was stored."""
+        with file_lock(self.file_path):
+            results = dict(self.load_all())
+            if group_name not in results:
+                return False
+            del results[group_name]
+            self.save_all(results)
+            return True
+
+
+def _on_group_changed(group_name: str) -> None:
+    MeetingResultsRepository().delete(group_name)
+
+
+def _on_account_location_changed(email: str) -> None:
+    results_repo = MeetingResultsRepository()
+    for group_name in GroupsRepository().get_user_groups(email):
+        results_repo.delete(group_name)
+
+
+def register_invalidation_hooks() -> None:
+    """Drop stored results when a group's membership or a member's location changes."""
+    events.subscribe(events.GROUP_CHANGED, _on_group_changed)
+    events.subscribe(events.ACCOUNT_LOCATION_CHANGED, _on_account_location_changed)
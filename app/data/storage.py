@@ -0,0 +1,447 @@
+"""Embedded SQLite storage behind the repositories."""
+import copy
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# One database file holds every repository table
+DEFAULT_DB_PATH = "social_compass.db"
+
+# Seconds a writer waits for another connection's lock before failing
+BUSY_TIMEOUT_S = 10
+
+# Attempts of a compare-and-swap update before giving up, and the base backoff
+CAS_RETRIES = 8
+CAS_BACKOFF_S = 0.02
+
+# Returned by an update's mutate function to delete the document
+DELETE = object()
+
+# Writes append to the write-ahead log; a background compactor folds it back
+# into the database file once it grows past COMPACT_WAL_BYTES or has been
+# waiting COMPACT_INTERVAL_S, checking every COMPACT_POLL_S
+COMPACT_WAL_BYTES = 4 * 1024 * 1024
+COMPACT_INTERVAL_S = 60
+COMPACT_POLL_S = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    email TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS groups (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    search_id INTEGER
+);
+CREATE TABLE IF NOT EXISTS group_members (
+    email TEXT NOT NULL,
+    group_name TEXT NOT NULL,
+    PRIMARY KEY (email, group_name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS group_members_by_group ON group_members (group_name);
+CREATE TABLE IF NOT EXISTS migrations (
+    source TEXT PRIMARY KEY,
+    imported_at TEXT NOT NULL
+);
+"""
+
+# Group search index; created only where this SQLite build has FTS5 with
+# the trigram tokenizer (3.34+), otherwise searches scan the groups table
+_SEARCH_INDEX_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS groups_search USING fts5(name, vibe, tokenize='trigram')"
+
+# Document tables, each versioned for compare-and-swap updates
+_DOCUMENT_TABLES = ("accounts", "groups")
+
+# Connections are per thread (Streamlit runs each session in its own thread)
+_local = threading.local()
+
+# Databases whose compactor runs in this process
+_compactors: set = set()
+_compactors_lock = threading.Lock()
+
+# Parsed tables shared by every repository in this process:
+# (db_path, table) -> (file stamp when read, {key: document})
+_views: Dict[Tuple[str, str], Tuple[tuple, Dict[str, Dict]]] = {}
+_views_lock = threading.Lock()
+
+# Whether this process's SQLite library supports the search index, once probed
+_search_index_supported: Optional[bool] = None
+
+# Migrations already checked by this process
+_migrated: set = set()
+_migrated_lock = threading.Lock()
+
+
+def get_connection(db_path: str = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    """This thread's connection to db_path, creating the schema on first use."""
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_S)
+        # Journaled writes: a commit appends its changed pages to the WAL and
+        # only syncs at compaction; checkpoints are left to the compactor
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA wal_autocheckpoint=0")
+        conn.executescript(_SCHEMA)
+        _add_version_columns(conn)
+        _add_search_ids(conn)
+        if has_search_index():
+            conn.execute(_SEARCH_INDEX_SCHEMA)
+        connections[db_path] = conn
+        _start_compactor(db_path)
+    return conn
+
+
+def has_search_index() -> bool:
+    """Whether groups_search is available, probed once per process on a scratch database."""
+    global _search_index_supported
+    if _search_index_supported is None:
+        probe = sqlite3.connect(":memory:")
+        try:
+            probe.execute(_SEARCH_INDEX_SCHEMA)
+            _search_index_supported = True
+        except sqlite3.OperationalError:
+            print("⚠️ SQLite has no FTS5 trigram tokenizer; group search falls back to LIKE scans")
+            _search_index_supported = False
+        finally:
+            probe.close()
+    return _search_index_supported
+
+
+def _file_stamp(db_path: str) -> tuple:
+    """Modification time and size of the database and its WAL; any commit changes it."""
+    stamp = []
+    for path in (db_path, f"{db_path}-wal"):
+        try:
+            stat = os.stat(path)
+            stamp += [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            stamp += [0, 0]
+    return tuple(stamp)
+
+
+def invalidate(db_path: str = DEFAULT_DB_PATH) -> None:
+    """Drop this process's parsed tables of db_path."""
+    with _views_lock:
+        for key in [key for key in _views if key[0] == db_path]:
+            del _views[key]
+
+
+def compact(db_path: str = DEFAULT_DB_PATH) -> bool:
+    """
+    Fold the write-ahead log into the database file and truncate it.
+    Returns False if readers kept it from completing; it is retried later.
+    """
+    busy, _, _ = get_connection(db_path).execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+    return not busy
+
+
+def _compact_forever(db_path: str) -> None:
+    wal_path = f"{db_path}-wal"
+    last_compacted = time.monotonic()
+    while True:
+        time.sleep(COMPACT_POLL_S)
+        try:
+            wal_bytes = os.path.getsize(wal_path)
+        except OSError:
+            continue
+        waited = time.monotonic() - last_compacted
+        if wal_bytes >= COMPACT_WAL_BYTES or (wal_bytes and waited >= COMPACT_INTERVAL_S):
+            try:
+                if compact(db_path):
+                    last_compacted = time.monotonic()
+            except sqlite3.Error as e:
+                print(f"⚠️ Compacting {db_path} failed: {e}")
+
+
+def _start_compactor(db_path: str) -> None:
+    """Start the background compactor for db_path once per process."""
+    with _compactors_lock:
+        if db_path in _compactors:
+            return
+        _compactors.add(db_path)
+    threading.Thread(target=_compact_forever, args=(db_path,), name="storage-compactor",
+                     daemon=True).start()
+
+
+def _add_version_columns(conn: sqlite3.Connection) -> None:
+    """Give document tables created before versioning their version column."""
+    for table in _DOCUMENT_TABLES:
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if "version" not in columns:
+            try:
+                with conn:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+            except sqlite3.OperationalError:
+                pass  # Another connection added it first
+
+
+def _add_search_ids(conn: sqlite3.Connection) -> None:
+    """
+    Give groups the explicit id their groups_search entry is keyed by. The
+    implicit rowid of a table with a text primary key may change on VACUUM.
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(groups)")}
+    if "search_id" not in columns:
+        try:
+            with conn:
+                conn.execute("ALTER TABLE groups ADD COLUMN search_id INTEGER")
+        except sqlite3.OperationalError:
+            pass  # Another connection added it first
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS groups_by_search_id ON groups (search_id)")
+
+
+class WriteConflict(RuntimeError):
+    """A compare-and-swap update kept losing to concurrent writers."""
+
+
+def run_migration(source: str, migrate: Callable[[sqlite3.Connection], None],
+                  db_path: str = DEFAULT_DB_PATH) -> bool:
+    """
+    Run migrate(conn) once per database, in one transaction recorded in the
+    migrations table under source. Returns True if it ran now.
+    """
+    with _migrated_lock:
+        if (db_path, source) in _migrated:
+            return False
+        _migrated.add((db_path, source))
+    with get_connection(db_path) as conn:
+        if conn.execute("SELECT 1 FROM migrations WHERE source = ?", (source,)).fetchone():
+            return False
+        migrate(conn)
+        conn.execute("INSERT OR IGNORE INTO migrations (source, imported_at) VALUES (?, ?)",
+                     (source, datetime.now().isoformat()))
+    invalidate(db_path)
+    return True
+
+
+class DocumentTable:
+    """
+    A table of JSON documents keyed by a text primary key.
+
+    Lookups, upserts and deletes touch one row, so their cost does not grow with
+    the number of stored documents. Documents are stored as compact JSON.
+
+    Every write bumps the row's version. update() reads a document and its
+    version, applies a change and writes it back only if the version is
+    unchanged, retrying on conflict, so concurrent read-modify-write cycles
+    from different sessions or processes never lose each other's changes.
+
+    Once load_all() has parsed the table, the documents are kept for the whole
+    process and reused while a stat of the database files shows no commit
+    since; local writes drop them right away.
+    """
+
+    def __init__(self, table: str, key_column: str, db_path: str = DEFAULT_DB_PATH):
+        self.table = table
+        self.key_column = key_column
+        self.db_path = db_path
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return get_connection(self.db_path)
+
+    def _cached_view(self) -> Optional[Dict[str, Dict]]:
+        """The parsed table if it is loaded and nothing was committed since."""
+        cached = _views.get((self.db_path, self.table))
+        if cached is None or cached[0] != _file_stamp(self.db_path):
+            return None
+        return cached[1]
+
+    def _view(self) -> Dict[str, Dict]:
+        """The parsed table, re-read only after a commit changed the files."""
+        view = self._cached_view()
+        if view is None:
+            stamp = _file_stamp(self.db_path)  # Taken first: a racing write only forces a re-read
+            rows = self.conn.execute(f"SELECT {self.key_column}, data FROM {self.table}")
+            view = {key: json.loads(data) for key, data in rows}
+            with _views_lock:
+                _views[(self.db_path, self.table)] = (stamp, view)
+        return view
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Document for key, None if missing."""
+        view = self._cached_view()
+        if view is not None:
+            return copy.deepcopy(view.get(key))
+        row = self.conn.execute(
+            f"SELECT data FROM {self.table} WHERE {self.key_column} = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_versioned(self, key: str) -> Tuple[Optional[Dict], Optional[int]]:
+        """Document and version for key, (None, None) if missing."""
+        row = self.conn.execute(
+            f"SELECT data, version FROM {self.table} WHERE {self.key_column} = ?", (key,)
+        ).fetchone()
+        return (json.loads(row[0]), row[1]) if row else (None, None)
+
+    def exists(self, key: str) -> bool:
+        """Check if a document is stored under key."""
+        return self.conn.execute(
+            f"SELECT 1 FROM {self.table} WHERE {self.key_column} = ?", (key,)
+        ).fetchone() is not None
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        """Documents for the given keys; missing keys are left out."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        view = self._cached_view()
+        if view is not None:
+            return {key: copy.deepcopy(view[key]) for key in keys if key in view}
+        placeholders = ",".join("?" * len(keys))
+        rows = self.conn.execute(
+            f"SELECT {self.key_column}, data FROM {self.table} WHERE {self.key_column} IN ({placeholders})",
+            keys
+        )
+        return {key: json.loads(data) for key, data in rows}
+
+    def put(self, key: str, document: Dict, conn: Optional[sqlite3.Connection] = None) -> None:
+        """Insert or replace one document. Pass conn to join an open transaction."""
+        (conn or self.conn).execute(
+            f"INSERT INTO {self.table} ({self.key_column}, data) VALUES (?, ?) "
+            f"ON CONFLICT({self.key_column}) DO UPDATE SET data = excluded.data, version = version + 1",
+            (key, json.dumps(document, separators=(",", ":")))
+        )
+        invalidate(self.db_path)
+        if conn is None:
+            self.conn.commit()
+
+    def insert(self, key: str, document: Dict, conn: Optional[sqlite3.Connection] = None) -> bool:
+        """Insert a document only if key is free. Returns False if it already exists."""
+        inserted = self._compare_and_put(conn or self.conn, key, document, None)
+        if conn is None:
+            self.conn.commit()
+        return inserted
+
+    def _compare_and_put(self, conn: sqlite3.Connection, key: str, document: Dict,
+                         version: Optional[int]) -> bool:
+        """Write document if the row is still at version (None: still missing)."""
+        data = json.dumps(document, separators=(",", ":"))
+        if version is None:
+            cursor = conn.execute(
+                f"INSERT INTO {self.table} ({self.key_column}, data) VALUES (?, ?) "
+                f"ON CONFLICT({self.key_column}) DO NOTHING",
+                (key, data)
+            )
+        else:
+            cursor = conn.execute(
+                f"UPDATE {self.table} SET data = ?, version = version + 1 "
+                f"WHERE {self.key_column} = ? AND version = ?",
+                (data, key, version)
+            )
+        invalidate(self.db_path)
+        return cursor.rowcount == 1
+
+    def update(self, key: str, mutate: Callable[[Optional[Dict]], Any],
+               on_write: Optional[Callable[[sqlite3.Connection, Any], None]] = None) -> Any:
+        """
+        Compare-and-swap read-modify-write of one document.
+
+        mutate gets the current document (None if missing) and returns the new
+        document, None to leave it as it is, or DELETE to remove it. It may run
+        more than once, so it should not have side effects. on_write(conn, new)
+        runs in the same transaction as a successful write, e.g. to update an
+        index; for DELETE it runs just before the row is removed.
+
+        Returns what mutate returned on the attempt that was applied. Raises
+        WriteConflict if CAS_RETRIES attempts all lost to concurrent writers.
+        """
+        for attempt in range(CAS_RETRIES):
+            document, version = self.get_versioned(key)
+            updated = mutate(document)
+            if updated is None:
+                return None
+            with self.conn as conn:
+                if updated is DELETE:
+                    if version is None:
+                        return DELETE
+                    if on_write is not None:
+                        on_write(conn, DELETE)
+                    written = conn.execute(
+                        f"DELETE FROM {self.table} WHERE {self.key_column} = ? AND version = ?",
+                        (key, version)
+                    ).rowcount == 1
+                    invalidate(self.db_path)
+                else:
+                    written = self._compare_and_put(conn, key, updated, version)
+                    if written and on_write is not None:
+                        on_write(conn, updated)
+                if not written:
+                    conn.rollback()
+            if written:
+                return updated
+            # Someone else wrote first: back off a little and retry on fresh data
+            time.sleep(CAS_BACKOFF_S * (attempt + 1) * random.random())
+        raise WriteConflict(f"Gave up updating {self.table} '{key}' after {CAS_RETRIES} conflicts")
+
+    def delete(self, key: str, conn: Optional[sqlite3.Connection] = None) -> bool:
+        """Delete one document. Returns True if it existed."""
+        cursor = (conn or self.conn).execute(
+            f"DELETE FROM {self.table} WHERE {self.key_column} = ?", (key,)
+        )
+        invalidate(self.db_path)
+        if conn is None:
+            self.conn.commit()
+        return cursor.rowcount > 0
+
+    def count(self) -> int:
+        """Number of stored documents."""
+        return self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def load_all(self) -> Dict[str, Dict]:
+        """
+        Every document, keyed by primary key, from the process-wide parsed table.
+        Returns deep copies like get(), so callers may mutate them freely.
+        """
+        return copy.deepcopy(self._view())
+
+    def replace_all(self, documents: Dict[str, Dict], conn: Optional[sqlite3.Connection] = None) -> None:
+        """Make the table hold exactly these documents, in one transaction."""
+        if conn is None:
+            with self.conn as conn:
+                self.replace_all(documents, conn)
+            return
+        existing = {key for (key,) in conn.execute(f"SELECT {self.key_column} FROM {self.table}")}
+        for key in existing - documents.keys():
+            self.delete(key, conn)
+        for key, document in documents.items():
+            self.put(key, document, conn)
+
+    def import_json(self, json_path: str) -> int:
+        """
+        One-time import of a legacy JSON file ({key: document}) into the table.
+        Returns the number of documents imported; 0 once the file was imported before.
+        """
+        imported = []
+
+        def migrate(conn: sqlite3.Connection) -> None:
+            try:
+                with open(json_path, "r") as f:
+                    documents = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                documents = {}
+            for key, document in documents.items():
+                # Rows written since (e.g. by another process) win over the legacy file
+                conn.execute(
+                    f"INSERT OR IGNORE INTO {self.table} ({self.key_column}, data) VALUES (?, ?)",
+                    (key, json.dumps(document, separators=(",", ":")))
+                )
+            imported.extend(documents)
+
+        run_migration(f"{self.table}:{os.path.abspath(json_path)}", migrate, self.db_path)
+        if imported:
+            print(f"📦 Imported {len(imported)} {self.table} from {json_path}")
+        return len(imported)
@@ -1,14 +1,30 @@
 """Services layer for Social Compass application."""
 from .oauth import OAuthService
 from .geocoding import GeocodingService
-from .meeting_optimizer import compute_equal_time_location
+from .meeting_optimizer import CancellationToken, compute_equal_time_location, iter_equal_time_location
+from .k_meeting_points import compute_k_meeting_points
+from .hubs import compute_hub_meeting_point, get_hub_catalogue
+from .time_slots import score_time_slots
+from .fairness_heatmap import get_fairness_surface
+from .meeting_result import MeetingResult
+from .optimization_jobs import OptimizationJob, get_job_runner
 from .finding_places import find_places_by_category
 from .latlong_api import LatLongAPI
 
 __all__ = [
     'OAuthService', 
     'GeocodingService',
+    'CancellationToken',
     'compute_equal_time_location',
+    'iter_equal_time_location',
+    'compute_k_meeting_points',
+    'compute_hub_meeting_point',
+    'get_hub_catalogue',
+    'score_time_slots',
+    'get_fairness_surface',
+    'MeetingResult',
+    'OptimizationJob',
+    'get_job_runner',
     'find_places_by_category',
     'LatLongAPI'
 ]
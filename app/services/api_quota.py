@@ -0,0 +1,181 @@
+"""Process-wide LatLong API quota pool: key rotation, daily usage and rate limiting."""
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date
+from typing import Dict, List, Optional
+
+from app.data.credentials import CredentialsManager
+from app.data.file_store import atomic_write, file_lock
+
+# Requests per key per day, unless credentials.json sets latlong_daily_quota
+DEFAULT_DAILY_QUOTA = 5000
+
+# Account-wide token bucket: sustained requests per second and burst size
+RATE_LIMIT_PER_S = 5.0
+RATE_LIMIT_BURST = 10
+
+# Usage is written to disk after this many requests (and on key exhaustion)
+USAGE_FLUSH_EVERY = 10
+
+
+def _key_id(api_key: str) -> str:
+    """Stable short id for a key, so usage files never hold the secret."""
+    return hashlib.sha1(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+class QuotaExhausted(RuntimeError):
+    """Every LatLong key has used up today's requests."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the request rate."""
+
+    def __init__(self, rate: float = RATE_LIMIT_PER_S, capacity: int = RATE_LIMIT_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Take one token, waiting up to timeout seconds (forever if None)."""
+        give_up = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if give_up is not None:
+                wait = min(wait, give_up - time.monotonic())
+                if wait <= 0:
+                    return False
+            time.sleep(wait)
+
+
+class QuotaPool:
+    """
+    Several LatLong keys sharing one rate limit, with per-key daily usage.
+
+    acquire() hands out the first key that still has quota today, so keys are
+    used up in order and rotated when one runs out or the API reports it
+    exhausted. Usage is persisted per day so restarts keep counting, and
+    processes sharing the usage file add their requests to it under a lock.
+    """
+
+    def __init__(self, api_keys: List[str], daily_quota: int = DEFAULT_DAILY_QUOTA,
+                 usage_path: str = "api_usage.json", bucket: Optional[TokenBucket] = None):
+        self.api_keys = list(dict.fromkeys(api_keys))
+        self.daily_quota = daily_quota
+        self.usage_path = usage_path
+        self.bucket = bucket or TokenBucket()
+        self._lock = threading.Lock()
+        self._day = date.today().isoformat()
+        self._usage: Dict[str, int] = self._load_usage()
+        self._exhausted: set = set()
+        self._unflushed: Dict[str, int] = {}  # Requests per key not yet added to the file
+
+    def _load_usage(self) -> Dict[str, int]:
+        try:
+            with open(self.usage_path, "r") as f:
+                return json.load(f).get(self._day, {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _flush(self) -> None:
+        """
+        Add this process's unflushed requests to today's counts on disk and
+        adopt the merged counts, which include other processes' requests.
+        Caller holds the lock.
+        """
+        with file_lock(self.usage_path):
+            usage = self._load_usage()
+            for key_id, count in self._unflushed.items():
+                usage[key_id] = usage.get(key_id, 0) + count
+            for key_id, count in self._usage.items():  # e.g. the file was removed
+                usage[key_id] = max(usage.get(key_id, 0), count)
+            atomic_write(self.usage_path, json.dumps({self._day: usage}, indent=2))
+        self._usage = usage
+        self._unflushed = {}
+
+    def _roll_day(self) -> None:
+        """Start fresh counts at midnight. Caller holds the lock."""
+        today = date.today().isoformat()
+        if today != self._day:
+            if self._unflushed:
+                self._flush()  # Yesterday's last requests
+            self._day = today
+            self._usage = {}
+            self._exhausted.clear()
+
+    def _key_remaining(self, api_key: str) -> int:
+        if _key_id(api_key) in self._exhausted:
+            return 0
+        return max(0, self.daily_quota - self._usage.get(_key_id(api_key), 0))
+
+    def remaining(self) -> int:
+        """Requests left today across all keys."""
+        with self._lock:
+            self._roll_day()
+            return sum(self._key_remaining(key) for key in self.api_keys)
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Reserve one request: wait for the rate limit, then count it against the
+        first key with quota left. Returns that key, or None when every key is
+        exhausted or the rate limit did not free up within timeout seconds.
+        """
+        if not self.remaining():
+            return None
+        if not self.bucket.acquire(timeout):
+            return None
+        with self._lock:
+            self._roll_day()
+            for key in self.api_keys:
+                if self._key_remaining(key) > 0:
+                    key_id = _key_id(key)
+                    self._usage[key_id] = self._usage.get(key_id, 0) + 1
+                    self._unflushed[key_id] = self._unflushed.get(key_id, 0) + 1
+                    if sum(self._unflushed.values()) >= USAGE_FLUSH_EVERY:
+                        self._flush()
+                    return key
+        return None
+
+    def mark_exhausted(self, api_key: str) -> None:
+        """Take a key out of rotation for the rest of the day."""
+        with self._lock:
+            self._exhausted.add(_key_id(api_key))
+            self._flush()
+        print(f"⚠️ LatLong key {_key_id(api_key)} exhausted, rotating to the next key")
+
+
+_pool: Optional[QuotaPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_quota_pool(fallback_key: Optional[str] = None) -> QuotaPool:
+    """
+    Get the process-wide quota pool, loading keys from credentials on first use.
+    fallback_key is only used when neither credentials nor the environment hold a key.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            credentials = CredentialsManager()
+            keys = credentials.get_latlong_api_keys()
+            env_key = os.getenv("LATLONG_API_KEY")
+            if env_key:
+                keys.insert(0, env_key)
+            if not keys and fallback_key:
+                keys.append(fallback_key)
+            _pool = QuotaPool(keys, credentials.get_latlong_daily_quota() or DEFAULT_DAILY_QUOTA)
+        return _pool
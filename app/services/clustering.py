@@ -0,0 +1,75 @@
+"""Member clustering used to bound routing cost for large groups."""
+import numpy as np
+import pandas as pd
+from typing import Tuple
+
+# Kilometres per degree of latitude
+KM_PER_DEGREE = 111.32
+
+
+def project_to_km(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """Project lat/lng to a local equirectangular plane in kilometres (n×2)."""
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    cos_lat = np.cos(np.radians(np.mean(lats)))
+    return np.column_stack([lats * KM_PER_DEGREE, lngs * KM_PER_DEGREE * cos_lat])
+
+
+def count_distinct(points: np.ndarray) -> int:
+    """Number of distinct rows in an (n×2) point array."""
+    return len(np.unique(points, axis=0)) if len(points) else 0
+
+
+def k_medoids(points: np.ndarray, k: int, max_iter: int = 50) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cluster points with alternating k-medoids.
+
+    Seeding is farthest-point from the most central point, so outlying members
+    get their own medoid instead of being averaged away. Duplicate points never
+    become two medoids, so k is capped at the number of distinct points.
+
+    Returns:
+        (medoid_indices, labels) where labels[i] indexes into medoid_indices
+    """
+    k = max(1, min(k, count_distinct(points)))
+    dist = np.linalg.norm(points[:, None, :] - points[None, :, :], axis=-1)
+
+    medoids = [int(np.argmin(dist.sum(axis=1)))]
+    while len(medoids) < k:
+        # The farthest point from every medoid is never a copy of one
+        medoids.append(int(np.argmax(dist[:, medoids].min(axis=1))))
+    medoids = np.array(medoids)
+
+    for _ in range(max_iter):
+        labels = np.argmin(dist[:, medoids], axis=1)
+        new_medoids = medoids.copy()
+        for c in range(k):
+            members = np.flatnonzero(labels == c)
+            if len(members):
+                within = dist[np.ix_(members, members)].sum(axis=1)
+                new_medoids[c] = members[np.argmin(within)]
+        if np.array_equal(new_medoids, medoids):
+            break
+        medoids = new_medoids
+
+    labels = np.argmin(dist[:, medoids], axis=1)
+    return medoids, labels
+
+
+def cluster_members(dataset: pd.DataFrame, k: int) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Reduce a member dataset to k medoid members weighted by cluster size.
+
+    Returns the representatives (the optimizer's user_id/lat/lng columns plus
+    'weight' and 'cluster_size') and each member's representative index.
+    Medoids are real member locations, so their routes are real.
+    """
+    points = project_to_km(dataset['lat'].values, dataset['lng'].values)
+    medoids, labels = k_medoids(points, k)
+    sizes = np.bincount(labels, minlength=len(medoids))
+
+    representatives = dataset.iloc[medoids][['user_id', 'lat', 'lng']].reset_index(drop=True)
+    representatives['weight'] = sizes / sizes.sum()
+    representatives['cluster_size'] = sizes
+    return representatives, labels
+
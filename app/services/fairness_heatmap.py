@@ -0,0 +1,173 @@
+"""Fairness surface over a group's region from a calibrated travel-time surrogate."""
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .clustering import KM_PER_DEGREE, project_to_km
+from .objectives import DEFAULT_OBJECTIVE, member_params, score_times
+from .optimization_jobs import get_job_key
+from .routes import RouteCache
+
+# Grid points per side of the group's bounding box
+HEATMAP_GRID_SIZE = 40
+
+# Grid points are kept inside the members' convex hull or this close to it.
+# Beyond the hull a straight-line surrogate rewards being far from everyone,
+# since equal distances look fair, so the surface stops just outside it.
+HEATMAP_HULL_BUFFER_KM = 0.5
+
+# Surrogate used until enough real routes are cached: minutes = a + b * km
+DEFAULT_SURROGATE = (5.0, 2.5)
+
+# Routed samples needed before the surrogate is fitted to them
+MIN_CALIBRATION_ROUTES = 5
+
+# Surfaces kept in memory, least recently used evicted first
+MAX_CACHED_SURFACES = 64
+
+_surfaces: "OrderedDict[str, dict]" = OrderedDict()
+_surfaces_lock = threading.Lock()
+
+
+def _distance_km(lat1, lng1, lat2, lng2) -> np.ndarray:
+    """Equirectangular distance in km; broadcasts over array inputs."""
+    cos_lat = np.cos(np.radians((lat1 + lat2) / 2))
+    return np.hypot(lat2 - lat1, (lng2 - lng1) * cos_lat) * KM_PER_DEGREE
+
+
+def calibrate_surrogate(route_cache: Optional[RouteCache]) -> Tuple[float, float]:
+    """
+    Fit minutes = a + b * straight-line km to the routed durations in a cache.
+    Falls back to DEFAULT_SURROGATE when there are too few usable routes.
+    """
+    if route_cache is None or len(route_cache) < MIN_CALIBRATION_ROUTES:
+        return DEFAULT_SURROGATE
+    endpoints, duration_s, distance_m = route_cache.samples()
+    found = distance_m > 0  # Skip the penalty entries of routes that were not found
+    if found.sum() < MIN_CALIBRATION_ROUTES:
+        return DEFAULT_SURROGATE
+
+    km = _distance_km(*endpoints[found].T)
+    minutes = duration_s[found] / 60
+    slope, intercept = np.polyfit(km, minutes, 1)
+    if slope <= 0:
+        return DEFAULT_SURROGATE
+    return float(max(intercept, 0.0)), float(slope)
+
+
+def _cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """z component of the cross product of 2-D vectors; broadcasts."""
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+def _convex_hull(points: np.ndarray) -> np.ndarray:
+    """Counter-clockwise hull vertices of (n, 2) points (monotone chain)."""
+    points = np.unique(points, axis=0)
+    if len(points) < 3:
+        return points
+
+    def half(ordered):
+        chain = []
+        for point in ordered:
+            while len(chain) >= 2 and _cross(chain[-1] - chain[-2], point - chain[-2]) <= 0:
+                chain.pop()
+            chain.append(point)
+        return chain[:-1]
+
+    return np.array(half(points) + half(points[::-1]))
+
+
+def _near_hull(grid: np.ndarray, hull: np.ndarray, buffer_km: float) -> np.ndarray:
+    """Mask of grid points inside the hull or within buffer_km of its boundary."""
+    starts = hull
+    ends = np.roll(hull, -1, axis=0)
+    edges = ends - starts
+    offsets = grid[:, None, :] - starts[None, :, :]
+    # Distance to every hull edge (a lone vertex is a zero-length edge)
+    length_sq = np.maximum((edges ** 2).sum(axis=1), 1e-12)
+    t = np.clip((offsets * edges).sum(axis=2) / length_sq, 0, 1)
+    nearest = np.linalg.norm(offsets - t[..., None] * edges, axis=2).min(axis=1)
+    if len(hull) < 3:
+        return nearest <= buffer_km
+    inside = (_cross(edges[None, :, :], offsets) >= 0).all(axis=1)
+    return inside | (nearest <= buffer_km)
+
+
+def compute_fairness_surface(dataset: pd.DataFrame,
+                             route_cache: Optional[RouteCache] = None,
+                             objective: str = DEFAULT_OBJECTIVE,
+                             objective_params: Optional[dict] = None,
+                             grid_size: int = HEATMAP_GRID_SIZE,
+                             surrogate: Optional[Tuple[float, float]] = None) -> dict:
+    """
+    Score the fairness objective on a grid over the members' convex hull.
+
+    Travel times come from a linear surrogate calibrated on route_cache (e.g.
+    a result's 'route_cache'), so the whole grid costs no API calls and is
+    scored as one points×members matrix. surrogate skips the calibration
+    when the caller already fitted (a, b). The grid spans the members' bounding
+    box and keeps the points within HEATMAP_HULL_BUFFER_KM of their hull.
+
+    Returns:
+        Dict with flat 'lat', 'lng' and 'score' arrays, 'relative' (score minus
+        the best score on the grid), 'best_point' and 'surrogate' (a, b)
+    """
+    lats = dataset['lat'].values.astype(float)
+    lngs = dataset['lng'].values.astype(float)
+    pad_lat = HEATMAP_HULL_BUFFER_KM / KM_PER_DEGREE
+    pad_lng = pad_lat / max(np.cos(np.radians(lats.mean())), 0.1)
+
+    grid_lat, grid_lng = np.meshgrid(
+        np.linspace(lats.min() - pad_lat, lats.max() + pad_lat, grid_size),
+        np.linspace(lngs.min() - pad_lng, lngs.max() + pad_lng, grid_size),
+        indexing='ij'
+    )
+    # Project members and grid together so both share one plane
+    projected = project_to_km(np.concatenate([lats, grid_lat.ravel()]),
+                              np.concatenate([lngs, grid_lng.ravel()]))
+    keep = _near_hull(projected[len(lats):], _convex_hull(projected[:len(lats)]), HEATMAP_HULL_BUFFER_KM)
+    grid_lat = grid_lat.ravel()[keep]
+    grid_lng = grid_lng.ravel()[keep]
+
+    intercept, slope = surrogate or calibrate_surrogate(route_cache)
+    times = intercept + slope * _distance_km(grid_lat[:, None], grid_lng[:, None],
+                                             lats[None, :], lngs[None, :])
+
+    scores = score_times(times, objective, **member_params(objective_params, dataset['user_id']))
+    best = int(np.argmin(scores))
+
+    return {
+        'lat': grid_lat,
+        'lng': grid_lng,
+        'score': scores,
+        'relative': scores - scores[best],
+        'best_point': (grid_lat[best], grid_lng[best]),
+        'surrogate': (intercept, slope),
+        'objective': objective
+    }
+
+
+def get_fairness_surface(group_name: str, dataset: pd.DataFrame,
+                         route_cache: Optional[RouteCache] = None,
+                         objective: str = DEFAULT_OBJECTIVE,
+                         objective_params: Optional[dict] = None) -> dict:
+    """Fairness surface for a group, cached per member-set hash, objective and surrogate."""
+    surrogate = calibrate_surrogate(route_cache)
+    key = (f"{get_job_key(group_name, dataset)}:{objective}:{sorted((objective_params or {}).items())}"
+           f":{surrogate[0]:.4f},{surrogate[1]:.4f}")
+    with _surfaces_lock:
+        if key in _surfaces:
+            _surfaces.move_to_end(key)
+            return _surfaces[key]
+
+    surface = compute_fairness_surface(dataset, route_cache, objective, objective_params,
+                                       surrogate=surrogate)
+
+    with _surfaces_lock:
+        _surfaces[key] = surface
+        while len(_surfaces) > MAX_CACHED_SURFACES:
+            _surfaces.popitem(last=False)
+    return surface
@@ -1,6 +1,7 @@
 """Geocoding service for address to coordinates conversion."""
 from typing import Optional, Tuple
 from .latlong_api import LatLongAPI
+from .api_quota import get_quota_pool
 from app.data.credentials import CredentialsManager
 
 
@@ -12,10 +13,9 @@ class GeocodingService:
     
     def get_coordinates(self, address: str) -> Optional[Tuple[float, float]]:
         """Get coordinates for an address using LatLong API."""
-        api_key = self.credentials.get_latlong_api_key()
-        if not api_key or api_key == "YOUR_LATLONG_API_KEY_HERE":
+        if not self.credentials.get_latlong_api_keys():
             return None
         
-        api = LatLongAPI(api_key)
+        api = LatLongAPI(quota=get_quota_pool())
         return api.geocode(address)
 
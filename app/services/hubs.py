@@ -0,0 +1,349 @@
+"""Catalogue of real meeting places (metro stations, malls, landmarks) used as candidates."""
+import json
+import os
+import threading
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+from app.data.file_store import atomic_write, cached_load, file_lock
+
+from . import meeting_optimizer
+from .clustering import KM_PER_DEGREE
+from .meeting_optimizer import (
+    LARGE_GROUP_CLUSTERS,
+    CancellationToken,
+    OptimizationRun,
+    candidate_spot,
+    compute_equal_time_location,
+    get_route_geometries,
+    get_travel_times,
+    member_weights,
+    result_route_cache,
+    route_matrix,
+    search_members
+)
+from .objectives import DEFAULT_OBJECTIVE, get_objective
+
+# Hand-picked hubs per city; landmarks fetched from LatLong are added on top
+SEED_HUBS: Dict[str, List[Tuple[str, str, float, float]]] = {
+    "bengaluru": [
+        ("MG Road Metro", "metro", 12.9755, 77.6066),
+        ("Cubbon Park Metro", "metro", 12.9810, 77.5970),
+        ("Kempegowda Majestic Metro", "metro", 12.9757, 77.5729),
+        ("Indiranagar Metro", "metro", 12.9784, 77.6408),
+        ("Baiyappanahalli Metro", "metro", 12.9907, 77.6525),
+        ("Jayanagar Metro", "metro", 12.9293, 77.5800),
+        ("Forum Mall Koramangala", "mall", 12.9345, 77.6112),
+        ("Phoenix Marketcity", "mall", 12.9975, 77.6960),
+        ("Orion Mall", "mall", 13.0110, 77.5550),
+        ("Mantri Square Mall", "mall", 12.9916, 77.5708),
+        ("UB City", "landmark", 12.9716, 77.5960),
+        ("Lalbagh Botanical Garden", "landmark", 12.9507, 77.5848),
+    ],
+    "delhi_ncr": [
+        ("Rajiv Chowk Metro", "metro", 28.6328, 77.2197),
+        ("Kashmere Gate Metro", "metro", 28.6675, 77.2281),
+        ("Hauz Khas Metro", "metro", 28.5433, 77.2066),
+        ("HUDA City Centre Metro", "metro", 28.4594, 77.0727),
+        ("MG Road Metro Gurugram", "metro", 28.4796, 77.0801),
+        ("Select Citywalk", "mall", 28.5286, 77.2190),
+        ("Ambience Mall Gurugram", "mall", 28.5050, 77.0960),
+        ("DLF Mall of India", "mall", 28.5675, 77.3210),
+        ("Cyber Hub", "landmark", 28.4950, 77.0890),
+        ("India Gate", "landmark", 28.6129, 77.2295),
+    ],
+}
+
+# Grid cell size of the spatial index (~5.5 km of latitude)
+HUB_INDEX_CELL_DEG = 0.05
+
+# Hubs this far outside the members' bounding box still count as in the region
+HUB_REGION_PADDING_KM = 2.0
+
+# Fetch landmarks around the group when the region has fewer hubs than this
+MIN_REGION_HUBS = 4
+
+
+def _hub_key(hub: Dict) -> Tuple[float, float]:
+    return (round(hub['lat'], 5), round(hub['lng'], 5))
+
+
+def _geographic_center(dataset: pd.DataFrame) -> Tuple[float, float]:
+    """Weighted mean member location; costs no routing calls"""
+    weights = member_weights(dataset)
+    return (float(np.average(dataset['lat'].values, weights=weights)),
+            float(np.average(dataset['lng'].values, weights=weights)))
+
+
+def _parse_landmark(item: Dict) -> Optional[Dict]:
+    """Normalize one landmarks.json entry to a hub dict, None without coordinates"""
+    if not isinstance(item, dict):
+        return None
+    # Handle inconsistent API spelling (coordintes vs coordinates)
+    coords = item.get("coordinates") or item.get("coordintes") or item
+    lat = coords.get("latitude", coords.get("lat"))
+    lng = coords.get("longitude", coords.get("lon", coords.get("lng")))
+    try:
+        lat, lng = float(lat), float(lng)
+    except (TypeError, ValueError):
+        return None
+    return {
+        'name': item.get("name") or item.get("landmark") or "Landmark",
+        'kind': "landmark",
+        'city': None,
+        'lat': lat,
+        'lng': lng,
+        'source': "landmarks"
+    }
+
+
+class HubIndex:
+    """Uniform lat/lng grid over the hub catalogue for bounding-box queries."""
+
+    def __init__(self, hubs: List[Dict], cell_deg: float = HUB_INDEX_CELL_DEG):
+        self.hubs = list(hubs)
+        self.cell_deg = cell_deg
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        for i, hub in enumerate(self.hubs):
+            self._cells.setdefault(self._cell(hub['lat'], hub['lng']), []).append(i)
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return (int(np.floor(lat / self.cell_deg)), int(np.floor(lng / self.cell_deg)))
+
+    def query(self, min_lat: float, min_lng: float, max_lat: float, max_lng: float) -> List[Dict]:
+        """Hubs inside the bounding box."""
+        lo = self._cell(min_lat, min_lng)
+        hi = self._cell(max_lat, max_lng)
+        n_cells = (hi[0] - lo[0] + 1) * (hi[1] - lo[1] + 1)
+
+        # A box wider than the catalogue is cheaper to scan directly
+        if n_cells > len(self._cells):
+            candidates = range(len(self.hubs))
+        else:
+            candidates = [
+                idx
+                for i in range(lo[0], hi[0] + 1)
+                for j in range(lo[1], hi[1] + 1)
+                for idx in self._cells.get((i, j), ())
+            ]
+
+        return [
+            self.hubs[idx] for idx in candidates
+            if min_lat <= self.hubs[idx]['lat'] <= max_lat
+            and min_lng <= self.hubs[idx]['lng'] <= max_lng
+        ]
+
+
+class HubCatalogue:
+    """Seed hubs plus landmarks learned from LatLong, persisted to a JSON file."""
+
+    def __init__(self, file_path: str = "hubs.json"):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        self._index: Optional[HubIndex] = None
+        self._index_stamp: Optional[Tuple[int, int]] = None  # Hubs file mtime and size it was built from
+        self._fetched_cells: set = set()  # Index cells whose landmarks were already fetched
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load_learned(self) -> List[Dict]:
+        return list(cached_load(self.file_path, self._read_learned))
+
+    def _read_learned(self) -> List[Dict]:
+        try:
+            with open(self.file_path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def load_all(self) -> List[Dict]:
+        """All hubs: the seed catalogue followed by learned landmarks."""
+        hubs = [
+            {'name': name, 'kind': kind, 'city': city, 'lat': lat, 'lng': lng, 'source': "seed"}
+            for city, entries in SEED_HUBS.items()
+            for name, kind, lat, lng in entries
+        ]
+        return hubs + self._load_learned()
+
+    def index(self) -> HubIndex:
+        """
+        Spatial index over the catalogue, reused until the hubs file changes,
+        e.g. when another process learned new landmarks.
+        """
+        stamp = self._file_stamp()
+        with self._lock:
+            if self._index is None or stamp != self._index_stamp:
+                self._index = HubIndex(self.load_all())
+                self._index_stamp = stamp
+            return self._index
+
+    def add_hubs(self, hubs: List[Dict]) -> int:
+        """Persist new hubs, skipping ones already catalogued. Returns the number added."""
+        with self._lock, file_lock(self.file_path):
+            known = {_hub_key(hub) for hub in self.load_all()}
+            learned = self._load_learned()
+            added = 0
+            for hub in hubs:
+                if _hub_key(hub) not in known:
+                    known.add(_hub_key(hub))
+                    learned.append(hub)
+                    added += 1
+            if added:
+                atomic_write(self.file_path, json.dumps(learned, indent=2))
+                self._index = None
+            return added
+
+    def _landmark_cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return (int(np.floor(lat / HUB_INDEX_CELL_DEG)), int(np.floor(lng / HUB_INDEX_CELL_DEG)))
+
+    def landmarks_fetched(self, lat: float, lng: float) -> bool:
+        """Whether this process already fetched the landmarks around a point's index cell."""
+        with self._lock:
+            return self._landmark_cell(lat, lng) in self._fetched_cells
+
+    def refresh_from_landmarks(self, lat: float, lng: float) -> int:
+        """
+        Add the landmarks LatLong knows around a point. Returns the number added.
+        A successful lookup marks the point's index cell as fetched.
+        """
+        data = meeting_optimizer.latlong.landmarks(lat, lng)
+        if not isinstance(data, list):
+            return 0
+        with self._lock:
+            self._fetched_cells.add(self._landmark_cell(lat, lng))
+        hubs = [hub for hub in map(_parse_landmark, data) if hub is not None]
+        return self.add_hubs(hubs)
+
+    def hubs_in_region(self, dataset: pd.DataFrame,
+                       padding_km: float = HUB_REGION_PADDING_KM) -> List[Dict]:
+        """Hubs inside the members' bounding box, padded by padding_km."""
+        lats = dataset['lat'].values.astype(float)
+        lngs = dataset['lng'].values.astype(float)
+        pad_lat = padding_km / KM_PER_DEGREE
+        pad_lng = pad_lat / max(np.cos(np.radians(np.mean(lats))), 0.1)
+        return self.index().query(lats.min() - pad_lat, lngs.min() - pad_lng,
+                                  lats.max() + pad_lat, lngs.max() + pad_lng)
+
+
+_catalogue: Optional[HubCatalogue] = None
+_catalogue_lock = threading.Lock()
+
+
+def get_hub_catalogue() -> HubCatalogue:
+    """Get the process-wide hub catalogue, creating it on first use."""
+    global _catalogue
+    with _catalogue_lock:
+        if _catalogue is None:
+            _catalogue = HubCatalogue()
+        return _catalogue
+
+
+def compute_hub_meeting_point(dataset: pd.DataFrame,
+                              objective: str = DEFAULT_OBJECTIVE,
+                              deadline: Optional[float] = None,
+                              cancel_token: Optional[CancellationToken] = None,
+                              objective_params: Optional[dict] = None,
+                              catalogue: Optional[HubCatalogue] = None) -> dict:
+    """
+    Pick the fairest catalogued hub inside the group's region.
+
+    Hubs in the members' bounding box are routed into one candidates×members
+    travel-time matrix, nearest to the weighted centroid first and capped by the
+    API budget, then scored with the objective in a single vectorized pass.
+    Falls back to the free search when the region has no hubs.
+
+    Returns the same keys as compute_equal_time_location, plus 'hub' (the
+    chosen hub) and 'hub_candidates' (the hubs that were routed).
+    """
+    get_objective(objective)  # Fail fast on an unknown objective name
+    catalogue = catalogue or get_hub_catalogue()
+    run = OptimizationRun(deadline, cancel_token, objective, objective_params)
+    n_users = len(dataset)
+
+    print("🚇 HUB MEETING-POINT FINDER")
+    print("=" * 60)
+
+    hubs = catalogue.hubs_in_region(dataset)
+    center = _geographic_center(dataset)
+    # A sparse region is looked up once; later runs reuse what it learned
+    if len(hubs) < MIN_REGION_HUBS and not catalogue.landmarks_fetched(*center):
+        run.api_calls += 1  # The landmarks lookup spends budget like a route
+        if catalogue.refresh_from_landmarks(*center):
+            hubs = catalogue.hubs_in_region(dataset)
+
+    if not hubs:
+        print("⚠️ No hubs in the group's region, falling back to free search")
+        return compute_equal_time_location(dataset, deadline=deadline, cancel_token=cancel_token,
+                                           objective=objective, objective_params=objective_params)
+
+    # Large groups are routed through weighted representatives
+    search_dataset, _ = search_members(dataset, run, LARGE_GROUP_CLUSTERS)
+    weights = member_weights(search_dataset)
+    n_search = len(search_dataset)
+
+    # Nearest hubs to the weighted centroid first, as many as the budget routes
+    center_lat, center_lng = _geographic_center(search_dataset)
+    hub_lats = np.array([hub['lat'] for hub in hubs])
+    hub_lngs = np.array([hub['lng'] for hub in hubs])
+    order = np.argsort(np.hypot(hub_lats - center_lat,
+                                (hub_lngs - center_lng) * np.cos(np.radians(center_lat))))
+    budget = max(1, (run.max_api_calls - run.reserve - run.api_calls) // n_search)
+    hubs = [hubs[i] for i in order[:budget]]
+    print(f"Users: {n_users} | Routed: {n_search} | Hubs: {len(hubs)} of {len(order)} in region")
+
+    # Shared candidates×members travel-time matrix
+    matrix, truncated = route_matrix([(hub['lat'], hub['lng']) for hub in hubs], search_dataset, run)
+    hubs = hubs[:len(matrix)]
+
+    scores = run.score(matrix, search_dataset)
+    ranked = np.argsort(scores)
+    best_hub = hubs[ranked[0]]
+    best_point = (best_hub['lat'], best_hub['lng'])
+
+    alternative_spots = []
+    for i in ranked[:5]:
+        spot = candidate_spot((hubs[i]['lat'], hubs[i]['lng']), matrix[i], float(scores[i]), weights)
+        spot['name'] = hubs[i]['name']
+        alternative_spots.append(spot)
+
+    # Routed for free unless the group was clustered; uncached members of a
+    # stopped run get the missing-route penalty
+    final_times = get_travel_times(best_point, dataset, run, skip_when_stopped=True)
+    truncated = truncated or bool(run.skipped_routes)
+    user_times_df = pd.DataFrame({
+        'user_id': dataset['user_id'].values,
+        'lat': dataset['lat'].values,
+        'lng': dataset['lng'].values,
+        'travel_time_min': final_times.round(1)
+    })
+
+    print(f"✅ {best_hub['name']} ({best_hub['kind']}), worst travel {final_times.max():.0f} min, "
+          f"{run.api_calls} API calls")
+
+    return {
+        'equal_point': best_point,
+        'travel_times_min': final_times,
+        'equality_score': np.std(final_times),
+        'avg_time_min': np.mean(final_times),
+        'time_spread': np.max(final_times) - np.min(final_times),
+        'user_times': user_times_df,
+        'n_api_calls': run.api_calls,
+        'alternative_spots': alternative_spots,
+        'truncated': truncated,
+        'objective': objective,
+        'score': run.score(final_times, dataset),
+        'mode': 'hub',
+        'warm_started': False,
+        'n_clusters': n_search if n_search < n_users else None,
+        'evaluated_points': [(hub['lat'], hub['lng'], float(s)) for hub, s in zip(hubs, scores)],
+        'route_cache': result_route_cache(best_point, dataset, run),
+        'route_geometries': get_route_geometries(best_point, dataset, run),
+        'hub': best_hub,
+        'hub_candidates': hubs
+    }
@@ -0,0 +1,191 @@
+"""Split a large or spread-out group across k meeting points (k-center style)."""
+import numpy as np
+import pandas as pd
+from typing import List, Optional
+
+from .clustering import count_distinct, k_medoids, project_to_km
+from .meeting_optimizer import (
+    CancellationToken,
+    OptimizationRun,
+    candidate_spot,
+    get_route_geometries,
+    get_travel_times,
+    member_weights,
+    route_matrix,
+    search_members
+)
+from .objectives import get_objective, member_params, score_times
+
+# Large groups are routed through this many weighted representatives
+K_POINT_REPRESENTATIVES = 6
+
+MAX_LLOYD_ITERATIONS = 20
+
+# Minimizing the worst trip per point is the classic k-center objective
+K_POINT_OBJECTIVE = 'minimax'
+
+
+def _k_point_candidates(search_dataset: pd.DataFrame, labels: np.ndarray, k: int) -> List[tuple]:
+    """Candidate points for every cluster, most promising first"""
+    lats = search_dataset['lat'].values
+    lngs = search_dataset['lng'].values
+    weights = member_weights(search_dataset)
+    if weights is None:
+        weights = np.ones(len(search_dataset))
+
+    group_center = (np.average(lats, weights=weights), np.average(lngs, weights=weights))
+    centroids, medians = [], []
+    for j in range(k):
+        idx = labels == j
+        if not idx.any():
+            continue
+        centroids.append((np.average(lats[idx], weights=weights[idx]),
+                          np.average(lngs[idx], weights=weights[idx])))
+        medians.append((np.median(lats[idx]), np.median(lngs[idx])))
+    # Points between a cluster and the group center trade local for global fairness
+    midpoints = [((c[0] + group_center[0]) / 2, (c[1] + group_center[1]) / 2) for c in centroids]
+
+    candidates, seen = [], set()
+    for point in centroids + [group_center] + midpoints + medians:
+        key = (round(point[0], 6), round(point[1], 6))
+        if key not in seen:
+            seen.add(key)
+            candidates.append(point)
+    return candidates
+
+
+def compute_k_meeting_points(dataset: pd.DataFrame, k: int = 2,
+                             objective: str = K_POINT_OBJECTIVE,
+                             deadline: Optional[float] = None,
+                             cancel_token: Optional[CancellationToken] = None,
+                             objective_params: Optional[dict] = None) -> dict:
+    """
+    Assign members to k meeting points and pick the points jointly.
+
+    Every candidate is routed once into a shared candidates×members travel-time
+    matrix. A Lloyd-style alternation then picks, for each cluster, the
+    candidate with the best objective over its members and reassigns every
+    member to its fastest chosen point. Both steps are vectorized over the
+    matrix, so extra points cost no extra routing calls.
+
+    Args:
+        dataset: DataFrame with user_id, lat and lng columns
+        k: Number of meeting points
+        objective: Name of a fairness objective in app.services.objectives,
+            minimized per meeting point
+        deadline: Optional time.monotonic() value after which no new routing
+            calls are issued; the matrix is built from the rows finished so far
+        cancel_token: Optional CancellationToken with the same effect
+        objective_params: Parameters for the objective, e.g. {'cap_min': 40}
+
+    Returns the same keys as compute_equal_time_location, with the point that
+    serves the most members as 'equal_point' and the other points as
+    'alternative_spots', plus 'meeting_points', 'assignments' (each member's
+    'point' index and route), 'max_time', 'candidate_points' and 'time_matrix'.
+    """
+    get_objective(objective)  # Fail fast on an unknown objective name
+    run = OptimizationRun(deadline, cancel_token, objective, objective_params)
+    n_users = len(dataset)
+    # Members sharing an address cannot be split across points
+    k = max(1, min(k, count_distinct(project_to_km(dataset['lat'].values, dataset['lng'].values))))
+
+    print(f"🎯 {k}-MEETING-POINT FINDER ({objective})")
+    print("=" * 60)
+
+    # Large groups are routed through weighted representatives
+    search_dataset, member_rep = search_members(dataset, run, max(k, K_POINT_REPRESENTATIVES))
+    weights = member_weights(search_dataset)
+    penalties = member_params(run.objective_params, search_dataset['user_id']).get('penalties')
+    n_search = len(search_dataset)
+
+    # Initial assignment by geography
+    points = project_to_km(search_dataset['lat'].values, search_dataset['lng'].values)
+    _, labels = k_medoids(points, k)
+
+    candidates = _k_point_candidates(search_dataset, labels, k)
+    candidates = candidates[:max(k, (run.max_api_calls - run.reserve) // n_search)]
+    print(f"Users: {n_users} | Routed: {n_search} | Candidates: {len(candidates)}")
+
+    # Shared candidates×members travel-time matrix
+    matrix, truncated = route_matrix(candidates, search_dataset, run)
+    candidates = candidates[:len(matrix)]
+
+    # Lloyd-style alternation: choose each cluster's point, then reassign members
+    choice = np.zeros(k, dtype=int)
+    for iteration in range(MAX_LLOYD_ITERATIONS):
+        for j in range(k):
+            idx = np.flatnonzero(labels == j)
+            if idx.size:
+                cluster_weights = weights[idx] if weights is not None else None
+                params = dict(run.objective_params)
+                if penalties is not None:
+                    params['penalties'] = np.asarray(penalties)[idx]
+                scores = score_times(matrix[:, idx], objective, cluster_weights, **params)
+                choice[j] = int(np.argmin(scores))
+        new_labels = np.argmin(matrix[choice], axis=0)
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+    print(f"Converged after {iteration + 1} iteration(s)")
+
+    meeting_points = [candidates[c] for c in choice]
+    member_labels = labels[member_rep]
+
+    # Route every member to their own point; free unless the group was clustered,
+    # and uncached members of a stopped run get the missing-route penalty
+    travel_times = np.empty(n_users)
+    geometries = [""] * n_users
+    for j, point in enumerate(meeting_points):
+        idx = np.flatnonzero(member_labels == j)
+        if idx.size:
+            travel_times[idx] = get_travel_times(point, dataset.iloc[idx], run, skip_when_stopped=True)
+            for i, geometry in zip(idx, get_route_geometries(point, dataset.iloc[idx], run)):
+                geometries[i] = geometry
+
+    truncated = truncated or bool(run.skipped_routes)
+
+    assignments = pd.DataFrame({
+        'user_id': dataset['user_id'].values,
+        'lat': dataset['lat'].values,
+        'lng': dataset['lng'].values,
+        'point': member_labels,
+        'travel_time_min': travel_times.round(1),
+        'route_geometry': geometries
+    })
+
+    print(f"✅ {k} meeting point(s), worst travel {travel_times.max():.0f} min, "
+          f"{run.api_calls} API calls")
+
+    # The point serving the most members stands in for the single point of the
+    # other finders; the rest are reported as its alternative spots
+    counts = np.bincount(member_labels, minlength=k)
+    point_spots = []
+    for j in np.argsort(-counts, kind='stable'):
+        idx = np.flatnonzero(member_labels == j)
+        if idx.size:
+            times = travel_times[idx]
+            point_spots.append(candidate_spot(meeting_points[j], times,
+                                              float(run.score(times, dataset.iloc[idx]))))
+    primary = int(np.argmax(counts))
+
+    return {
+        'equal_point': meeting_points[primary],
+        'travel_times_min': travel_times,
+        'time_spread': travel_times.max() - travel_times.min(),
+        'user_times': assignments,
+        'alternative_spots': point_spots[1:],
+        'score': run.score(travel_times, dataset),
+        'route_cache': run.cache.copy(with_geometry=False),
+        'route_geometries': geometries,
+        'mode': 'k_points',
+        'meeting_points': meeting_points,
+        'assignments': assignments,
+        'objective': objective,
+        'max_time': travel_times.max(),
+        'avg_time_min': travel_times.mean(),
+        'equality_score': travel_times.std(),
+        'n_api_calls': run.api_calls,
+        'truncated': truncated,
+        'candidate_points': candidates,
+        'time_matrix': matrix
+    }
@@ -1,25 +1,45 @@
 import requests
 
+from .routes import Route, parse_duration_seconds
+
 # ==========================================
 # LATLONG.AI API WRAPPER
 # ==========================================
 class LatLongAPI:
-    def __init__(self, api_key):
+    def __init__(self, api_key=None, timeout=10, quota=None):
+        """
+        Pass quota (a QuotaPool) to draw a key per request from the shared
+        pool and respect its rate limit instead of using api_key directly.
+        """
         self.base_url = "https://apihub.latlong.ai/v4"
         self.headers = {"X-Authorization-Token": api_key}
+        self.timeout = timeout
+        self.quota = quota
 
-    def _send_request(self, endpoint, params):
+    def _send_request(self, endpoint, params, timeout=None):
         """Internal helper to handle requests and errors"""
+        headers = self.headers
+        api_key = None
+        if self.quota is not None:
+            api_key = self.quota.acquire(timeout=timeout or self.timeout)
+            if api_key is None:
+                print(f"⚠️ API Warning ({endpoint}): quota exhausted or rate limited")
+                return None
+            headers = {"X-Authorization-Token": api_key}
         try:
             url = f"{self.base_url}{endpoint}"
-            resp = requests.get(url, headers=self.headers, params=params)
+            resp = requests.get(url, headers=headers, params=params,
+                                timeout=timeout or self.timeout)
             data = resp.json()
             
             # LatLong success codes can be status="success" or code=1001
             if data.get("status") == "success" or data.get("code") == 1001:
                 return data.get("data")
             else:
-                print(f"⚠️ API Warning ({endpoint}): {data.get('message') or data}")
+                message = str(data.get('message') or data)
+                if api_key and 'quota' in message.lower():
+                    self.quota.mark_exhausted(api_key)
+                print(f"⚠️ API Warning ({endpoint}): {message}")
                 return None
         except Exception as e:
             print(f"❌ Connection Error: {e}")
@@ -112,9 +132,11 @@ class LatLongAPI:
         }
         return self._send_request("/landmarks.json", params)
 
-    def get_route_data(self, start_coords, end_coords):
+    def get_route_data(self, start_coords, end_coords, timeout=None, departure_time=None):
         """
         Get driving route details (Time, Distance, Geometry).
+        Pass timeout (seconds) to cap this request below the client default.
+        Pass departure_time (datetime) for traffic at that time of day.
         """
         # Accepts tuples (lat, lon) or strings "lat,lon"
         if isinstance(start_coords, tuple): start_coords = f"{start_coords[0]},{start_coords[1]}"
@@ -124,7 +146,18 @@ class LatLongAPI:
             "origin": start_coords,
             "destination": end_coords
         }
-        return self._send_request("/directions.json", params)
+        if departure_time is not None:
+            params["departure_time"] = int(departure_time.timestamp())
+        return self._send_request("/directions.json", params, timeout=timeout)
+
+    def get_route(self, start_coords, end_coords, timeout=None, departure_time=None):
+        """
+        Get a driving route as a parsed Route (duration, distance, geometry).
+        Returns None when the API has no route.
+        """
+        data = self.get_route_data(start_coords, end_coords, timeout=timeout,
+                                   departure_time=departure_time)
+        return Route.from_response(data)
 
     def get_map_tile_html(self, lat, lon, zoom=15, mode="point"):
         """
@@ -154,16 +187,8 @@ class LatLongAPI:
 
     def parse_minutes(self, time_str):
         """Helper: Converts '1 hour, 10 minutes' -> 70 (integer)"""
-        if not time_str: return 0
-        minutes = 0
-        try:
-            parts = time_str.split(',')
-            for p in parts:
-                if 'hour' in p: minutes += int(p.split('hour')[0].strip()) * 60
-                if 'minute' in p: minutes += int(p.split('minute')[0].strip())
-        except:
-            return 0
-        return minutes
+        seconds = parse_duration_seconds(time_str)
+        return seconds // 60 if seconds else 0
 
 # ==========================================
 # EXAMPLES / TESTS
@@ -0,0 +1,124 @@
+"""Compact, immutable meeting result kept per group in session state."""
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Tuple
+
+from .meeting_optimizer import DEFAULT_MODE
+from .objectives import DEFAULT_OBJECTIVE
+from .routes import RouteCache
+
+# One row per alternative spot, fields named as in the optimizer's spot dicts
+ALTERNATIVE_DTYPE = np.dtype([
+    ('lat', np.float64),
+    ('lng', np.float64),
+    ('score', np.float64),
+    ('equality_score', np.float64),
+    ('avg_time', np.float64),
+    ('max_time', np.float64),
+    ('min_time', np.float64),
+    ('time_spread', np.float64),
+])
+
+
+def _frozen(values, dtype=None) -> np.ndarray:
+    """Read-only array copy, so a stored result cannot be changed through it."""
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+class MeetingResult:
+    """
+    Everything the find-meeting page shows for one group, in NumPy arrays.
+
+    Members are parallel arrays (user_ids, lats, lngs, travel_times_min) in the
+    optimizer's member order, and alternative spots are one ALTERNATIVE_DTYPE
+    record array, so a result is a handful of small buffers instead of a
+    DataFrame plus dicts. Instances are read-only and pickle by value.
+    """
+
+    __slots__ = ('user_ids', 'lats', 'lngs', 'travel_times_min', 'equal_point',
+                 'equality_score', 'avg_time_min', 'time_spread', 'score', 'objective',
+                 'truncated', 'alternative_spots', 'route_geometries', 'route_cache',
+                 'unrouted_members', 'mode')
+
+    def __init__(self, user_ids, lats, lngs, travel_times_min,
+                 equal_point: Tuple[float, float],
+                 equality_score: float, avg_time_min: float, time_spread: float,
+                 score: Optional[float] = None,
+                 objective: str = DEFAULT_OBJECTIVE,
+                 truncated: bool = False,
+                 alternative_spots=None,
+                 route_geometries: Optional[Tuple[str, ...]] = None,
+                 route_cache: Optional[RouteCache] = None,
+                 unrouted_members: Tuple[str, ...] = (),
+                 mode: str = DEFAULT_MODE):
+        fields = {
+            'user_ids': _frozen(user_ids, dtype=str),
+            'lats': _frozen(lats, dtype=float),
+            'lngs': _frozen(lngs, dtype=float),
+            'travel_times_min': _frozen(travel_times_min, dtype=float),
+            'equal_point': (float(equal_point[0]), float(equal_point[1])),
+            'equality_score': float(equality_score),
+            'avg_time_min': float(avg_time_min),
+            'time_spread': float(time_spread),
+            'score': float(score) if score is not None else None,
+            'objective': objective,
+            'truncated': bool(truncated),
+            'alternative_spots': _frozen(alternative_spots if alternative_spots is not None else [],
+                                         dtype=ALTERNATIVE_DTYPE),
+            'route_geometries': tuple(route_geometries) if route_geometries else None,
+            'route_cache': route_cache,
+            'unrouted_members': tuple(str(user_id) for user_id in unrouted_members),
+            'mode': mode,
+        }
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+    @classmethod
+    def from_result(cls, result: dict) -> "MeetingResult":
+        """Build from a compute_equal_time_location result dict."""
+        user_times = result['user_times']
+        alternatives = [tuple(spot[name] for name in ALTERNATIVE_DTYPE.names)
+                        for spot in result.get('alternative_spots') or []]
+        return cls(
+            user_ids=user_times['user_id'].astype(str).values,
+            lats=user_times['lat'].values,
+            lngs=user_times['lng'].values,
+            travel_times_min=user_times['travel_time_min'].values,
+            equal_point=result['equal_point'],
+            equality_score=result['equality_score'],
+            avg_time_min=result['avg_time_min'],
+            time_spread=result['time_spread'],
+            score=result.get('score'),
+            objective=result.get('objective', DEFAULT_OBJECTIVE),
+            truncated=result.get('truncated', False),
+            alternative_spots=alternatives,
+            route_geometries=result.get('route_geometries'),
+            route_cache=result.get('route_cache'),
+            unrouted_members=result.get('unrouted_members') or (),
+            mode=result.get('mode', DEFAULT_MODE),
+        )
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    @property
+    def member_data(self) -> List[dict]:
+        """Members as the user_id/lat/lng dicts the map helpers take."""
+        return [{'user_id': user_id, 'lat': lat, 'lng': lng}
+                for user_id, lat, lng in zip(self.user_ids.tolist(), self.lats.tolist(), self.lngs.tolist())]
+
+    @property
+    def dataset(self) -> pd.DataFrame:
+        """Members as a user_id/lat/lng DataFrame, built on demand."""
+        return pd.DataFrame({'user_id': self.user_ids, 'lat': self.lats, 'lng': self.lngs})
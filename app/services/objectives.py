@@ -0,0 +1,131 @@
+"""
+Vectorized fairness objectives for scoring meeting-point candidates.
+
+Every objective scores a whole candidates×members travel-time matrix (minutes)
+in one NumPy call and returns one score per candidate; lower is better.
+"""
+import numpy as np
+from typing import Callable, Dict, Iterable, Optional, Union
+
+# Weights of the default score: minimize spread first, then the worst trip
+STD_WEIGHT = 50
+MAX_WEIGHT = 2
+
+# mean_cap: minutes above which each trip is penalized, and the penalty per minute
+DEFAULT_CAP_MIN = 45
+DEFAULT_CAP_PENALTY = 10
+
+DEFAULT_OBJECTIVE = 'std_max'
+
+
+def _weighted_mean(times: np.ndarray, weights: Optional[np.ndarray]) -> np.ndarray:
+    return np.average(times, axis=1, weights=weights)
+
+
+def _weighted_std(times: np.ndarray, weights: Optional[np.ndarray]) -> np.ndarray:
+    mean = _weighted_mean(times, weights)
+    return np.sqrt(np.average((times - mean[:, None]) ** 2, axis=1, weights=weights))
+
+
+def std_max(times: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """Today's score: std dev * 50 + max * 2."""
+    return _weighted_std(times, weights) * STD_WEIGHT + times.max(axis=1) * MAX_WEIGHT
+
+
+def minimax(times: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """Worst travel time only."""
+    return times.max(axis=1)
+
+
+def variance(times: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """Travel-time variance."""
+    return _weighted_std(times, weights) ** 2
+
+
+def gini(times: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """Gini coefficient of travel times (0 = perfectly equal)."""
+    if weights is None:
+        weights = np.ones(times.shape[1])
+    order = np.argsort(times, axis=1)
+    sorted_times = np.take_along_axis(times, order, axis=1)
+    sorted_weights = weights[order] / weights.sum()
+
+    # Area under the Lorenz curve from cumulative time shares
+    shares = sorted_weights * sorted_times
+    totals = shares.sum(axis=1, keepdims=True)
+    lorenz = np.cumsum(shares, axis=1) / np.where(totals > 0, totals, 1)
+    previous = np.hstack([np.zeros((len(times), 1)), lorenz[:, :-1]])
+    return 1 - np.sum(sorted_weights * (lorenz + previous), axis=1)
+
+
+def mean_cap(times: np.ndarray, weights: Optional[np.ndarray] = None,
+             cap_min: float = DEFAULT_CAP_MIN,
+             cap_penalty: float = DEFAULT_CAP_PENALTY) -> np.ndarray:
+    """Average travel time plus a steep penalty for every minute over cap_min."""
+    overshoot = np.clip(times - cap_min, 0, None)
+    return _weighted_mean(times, weights) + cap_penalty * np.average(overshoot, axis=1, weights=weights)
+
+
+def weighted_penalty(times: np.ndarray, weights: Optional[np.ndarray] = None,
+                     penalties: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    std_max on per-member scaled times, e.g. penalties=1.5 for a member who
+    finds travel harder, so their minutes count for more.
+    """
+    if penalties is not None:
+        times = times * np.asarray(penalties, dtype=float)[None, :]
+    return std_max(times, weights)
+
+
+OBJECTIVES: Dict[str, Callable[..., np.ndarray]] = {
+    'std_max': std_max,
+    'minimax': minimax,
+    'variance': variance,
+    'gini': gini,
+    'mean_cap': mean_cap,
+    'weighted_penalty': weighted_penalty,
+}
+
+
+def register_objective(name: str, fn: Callable[..., np.ndarray]) -> None:
+    """Add an objective taking (times matrix, weights, **params) -> scores."""
+    OBJECTIVES[name] = fn
+
+
+def get_objective(name: str) -> Callable[..., np.ndarray]:
+    """Look up an objective by name."""
+    if name not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{name}'. Choose from {list(OBJECTIVES)}")
+    return OBJECTIVES[name]
+
+
+def member_params(objective_params: Optional[dict], user_ids: Iterable) -> dict:
+    """
+    Objective parameters for these members, in order. Penalties given as a
+    {user_id: factor} dict become a per-member array; unlisted members count as 1.
+    """
+    params = dict(objective_params or {})
+    penalties = params.get('penalties')
+    if isinstance(penalties, dict):
+        params['penalties'] = np.array([penalties.get(user_id, 1.0) for user_id in user_ids], dtype=float)
+    return params
+
+
+def score_times(times: np.ndarray, objective: str = DEFAULT_OBJECTIVE,
+                weights: Optional[np.ndarray] = None, **params) -> Union[np.ndarray, float]:
+    """
+    Score travel times with a named objective.
+
+    Args:
+        times: candidates×members matrix, or a single members vector
+        objective: Key of OBJECTIVES
+        weights: Optional per-member weights (e.g. cluster sizes)
+        **params: Objective parameters such as cap_min or penalties
+
+    Returns:
+        One score per candidate, or a float for a single vector
+    """
+    times = np.asarray(times, dtype=float)
+    single = times.ndim == 1
+    scores = get_objective(objective)(np.atleast_2d(times), weights, **params)
+    return float(scores[0]) if single else scores
@@ -0,0 +1,180 @@
+"""Process-wide background runner for meeting-point optimizations."""
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set
+
+import pandas as pd
+
+from .meeting_optimizer import (
+    DEFAULT_MODE,
+    CancellationToken,
+    check_mode,
+    compute_equal_time_location,
+    iter_equal_time_location
+)
+
+# Worker threads shared by every Streamlit session in this process
+MAX_WORKERS = 4
+
+# Finished jobs kept around so other sessions can pick up their results
+MAX_FINISHED_JOBS = 256
+
+
+def get_member_hash(dataset: pd.DataFrame) -> str:
+    """Hash of the members' ids and locations, independent of row order."""
+    members = sorted(
+        f"{row['user_id']}@{float(row['lat']):.6f},{float(row['lng']):.6f}"
+        for _, row in dataset.iterrows()
+    )
+    return hashlib.sha1("|".join(members).encode("utf-8")).hexdigest()[:16]
+
+
+def get_job_key(group_name: str, dataset: pd.DataFrame, mode: str = DEFAULT_MODE) -> str:
+    """Key a job by group name, a hash of the members' ids and locations, and its meeting mode."""
+    key = f"{group_name}:{get_member_hash(dataset)}"
+    return key if mode == DEFAULT_MODE else f"{key}:{mode}"
+
+
+class OptimizationJob:
+    """A submitted optimization, its latest progress event and its result."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, key: str):
+        self.key = key
+        self.status = self.QUEUED
+        self.progress: Optional[dict] = None
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.cancel_token = CancellationToken()
+        self.owners: Set[str] = set()
+        self.finished_at: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        """True while the job is queued or running."""
+        return self.status in (self.QUEUED, self.RUNNING)
+
+
+class OptimizationJobRunner:
+    """
+    Runs optimizations on a shared thread pool.
+
+    Jobs are deduplicated by key, so identical requests from different sessions
+    share one computation. Sessions register as owners; a job is cancelled only
+    once every owner has released it.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="meeting-optimizer")
+        self._jobs: Dict[str, OptimizationJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, group_name: str, dataset: pd.DataFrame, owner: str,
+               time_budget_s: Optional[float] = None,
+               previous_result: Optional[dict] = None,
+               mode: str = DEFAULT_MODE) -> OptimizationJob:
+        """
+        Submit an optimization, or join the running or finished job for the same key.
+        previous_result warm-starts a new job from an earlier result for the group;
+        mode is a meeting mode of compute_equal_time_location.
+        """
+        check_mode(mode)
+        key = get_job_key(group_name, dataset, mode)
+        with self._lock:
+            job = self._jobs.get(key)
+            # A job whose cancellation was requested is dead even while it winds down
+            if (job is None or job.status in (OptimizationJob.FAILED, OptimizationJob.CANCELLED)
+                    or job.cancel_token.cancelled):
+                job = OptimizationJob(key)
+                self._jobs[key] = job
+                self._executor.submit(self._run, job, dataset.copy(), time_budget_s, previous_result, mode)
+            job.owners.add(owner)
+            self._prune_finished()
+        return job
+
+    def get(self, key: str) -> Optional[OptimizationJob]:
+        """Get a job by key."""
+        with self._lock:
+            return self._jobs.get(key)
+
+    def release(self, key: str, owner: str) -> None:
+        """Drop an owner from a job, cancelling it if nobody is waiting anymore."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return
+            job.owners.discard(owner)
+            if not job.owners and job.active:
+                job.cancel_token.cancel()
+
+    def forget(self, key: str) -> None:
+        """Discard a finished job so the next submit recomputes it."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not job.active:
+                del self._jobs[key]
+
+    def _run(self, job: OptimizationJob, dataset: pd.DataFrame,
+             time_budget_s: Optional[float], previous_result: Optional[dict], mode: str) -> None:
+        """Worker body: drain the streaming optimizer into the job, or run another mode in one go."""
+        if job.cancel_token.cancelled:
+            self._finish(job, OptimizationJob.CANCELLED)
+            return
+
+        job.status = OptimizationJob.RUNNING
+        deadline = time.monotonic() + time_budget_s if time_budget_s else None
+        try:
+            if mode != DEFAULT_MODE:
+                job.result = compute_equal_time_location(dataset, deadline=deadline,
+                                                         cancel_token=job.cancel_token, mode=mode)
+            else:
+                for event in iter_equal_time_location(dataset, deadline=deadline,
+                                                      cancel_token=job.cancel_token,
+                                                      previous_result=previous_result):
+                    if event['done']:
+                        job.result = event['result']
+                    else:
+                        job.progress = event
+        except Exception as e:
+            job.error = str(e)
+            self._finish(job, OptimizationJob.FAILED)
+            return
+
+        if job.cancel_token.cancelled:
+            self._finish(job, OptimizationJob.CANCELLED)
+        else:
+            self._finish(job, OptimizationJob.DONE)
+
+    def _finish(self, job: OptimizationJob, status: str) -> None:
+        job.finished_at = time.time()
+        job.status = status
+
+    def _prune_finished(self) -> None:
+        """Keep at most MAX_FINISHED_JOBS finished jobs. Caller holds the lock."""
+        finished = [job for job in self._jobs.values() if not job.active]
+        if len(finished) <= MAX_FINISHED_JOBS:
+            return
+        finished.sort(key=lambda job: job.finished_at or 0)
+        for job in finished[:len(finished) - MAX_FINISHED_JOBS]:
+            del self._jobs[job.key]
+
+
+_runner: Optional[OptimizationJobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> OptimizationJobRunner:
+    """Get the process-wide job runner, creating it on first use."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = OptimizationJobRunner()
+        return _runner
@@ -0,0 +1,83 @@
+"""Warm meeting-point results in the background when groups or locations change."""
+import threading
+from typing import Dict, Optional
+
+import pandas as pd
+
+from app.data import AccountsRepository, GroupsRepository, events
+from .optimization_jobs import OptimizationJob, get_job_runner
+
+# Owner name the precompute jobs register under on the job runner
+PRECOMPUTE_OWNER = "precompute"
+
+# No one is waiting on these, so allow more wall time than the page does
+PRECOMPUTE_TIME_BUDGET_S = 60
+
+# group name -> key of the latest precompute job for that group
+_latest_jobs: Dict[str, str] = {}
+_latest_lock = threading.Lock()
+
+
+def build_group_dataset(group_data: Dict, accounts: Dict) -> pd.DataFrame:
+    """Build the optimizer input for a group: one row per member with a location."""
+    rows = []
+    for member_email in group_data.get("members", []):
+        member = accounts.get(member_email, {})
+        lat = member.get("lat")
+        lng = member.get("lng")
+        if lat and lng:
+            rows.append({
+                'user_id': member.get("name", member_email.split("@")[0]),
+                'lat': lat,
+                'lng': lng
+            })
+    return pd.DataFrame(rows, columns=['user_id', 'lat', 'lng'])
+
+
+def precompute_group(group_name: str, accounts: Optional[Dict] = None) -> None:
+    """
+    Queue a background optimization for one group, superseding its previous one.
+    A finished previous result warm-starts the new job.
+    """
+    group_data = GroupsRepository().get(group_name)
+    dataset = None
+    if group_data:
+        if accounts is None:
+            accounts = AccountsRepository().get_many(group_data.get("members", []))
+        dataset = build_group_dataset(group_data, accounts)
+
+    runner = get_job_runner()
+    with _latest_lock:
+        old_key = _latest_jobs.get(group_name)
+    old_job = runner.get(old_key) if old_key else None
+    previous_result = old_job.result if old_job and old_job.status == OptimizationJob.DONE else None
+
+    new_key = None
+    if dataset is not None and len(dataset) >= 2:
+        new_key = runner.submit(group_name, dataset, owner=PRECOMPUTE_OWNER,
+                                time_budget_s=PRECOMPUTE_TIME_BUDGET_S,
+                                previous_result=previous_result).key
+
+    with _latest_lock:
+        old_key = _latest_jobs.pop(group_name, None)
+        if new_key:
+            _latest_jobs[group_name] = new_key
+
+    # The old member set is stale; stop it unless a session is still waiting on it
+    if old_key and old_key != new_key:
+        runner.release(old_key, PRECOMPUTE_OWNER)
+
+
+def _on_group_changed(group_name: str) -> None:
+    precompute_group(group_name)
+
+
+def _on_account_location_changed(email: str) -> None:
+    for group_name in GroupsRepository().get_user_groups(email):
+        precompute_group(group_name)
+
+
+def register_precompute_hooks() -> None:
+    """Subscribe the precompute handlers to repository change events."""
+    events.subscribe(events.GROUP_CHANGED, _on_group_changed)
+    events.subscribe(events.ACCOUNT_LOCATION_CHANGED, _on_account_location_changed)
@@ -0,0 +1,177 @@
+"""Parsed route model and a compact travel-time cache."""
+import re
+import numpy as np
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+# Seconds charged for a route the API could not find
+MISSING_ROUTE_PENALTY_S = 900
+
+_DAYS = re.compile(r'(\d+)\s*days?\b')
+_HOURS = re.compile(r'(\d+)\s*(?:hours?|hrs?)\b')
+_MINUTES = re.compile(r'(\d+)\s*(?:minutes?|mins?)\b')
+_SECONDS = re.compile(r'(\d+)\s*(?:seconds?|secs?)\b')
+
+# Seconds per unit, in the order the units are matched
+_DURATION_UNITS = ((_DAYS, 86400), (_HOURS, 3600), (_MINUTES, 60), (_SECONDS, 1))
+_DISTANCE = re.compile(r'([\d.]+)\s*(km|m)\b')
+
+# One cache row per route: ~8 bytes instead of a boxed Python number per value
+ROUTE_DTYPE = np.dtype([('duration_s', np.int32), ('distance_m', np.int32)])
+
+
+def parse_duration_seconds(text) -> Optional[int]:
+    """Parse '45 secs', '25 mins' or '1 day 2 hours' to seconds, None if unparseable."""
+    if not text:
+        return None
+    text = str(text).lower()
+    matches = [(pattern.search(text), unit) for pattern, unit in _DURATION_UNITS]
+    if not any(match for match, _ in matches):
+        return None
+    return sum(int(match.group(1)) * unit for match, unit in matches if match)
+
+
+def parse_distance_metres(text) -> int:
+    """Parse '12.4 km' or '850 m' to metres, 0 if unparseable."""
+    match = _DISTANCE.search(str(text or "").lower())
+    if not match:
+        return 0
+    value = float(match.group(1))
+    return int(round(value * 1000 if match.group(2) == 'km' else value))
+
+
+class Route(NamedTuple):
+    """A driving route, parsed once from the directions response."""
+    duration_s: int
+    distance_m: int
+    geometry: str = ""  # Encoded polyline, empty when not returned
+
+    @classmethod
+    def from_response(cls, data) -> Optional["Route"]:
+        """Build a Route from a directions payload, None without a usable time."""
+        if not isinstance(data, dict):
+            return None
+        duration_s = parse_duration_seconds(data.get('time'))
+        if duration_s is None:
+            return None
+        geometry = data.get('geometry') or data.get('polyline') or ""
+        return cls(duration_s, parse_distance_metres(data.get('distance')),
+                   geometry if isinstance(geometry, str) else "")
+
+
+def decode_polyline(encoded: str, precision: int = 5) -> np.ndarray:
+    """
+    Decode an encoded polyline into an (n, 2) array of [lng, lat] pairs.
+
+    Vectorized over the characters: chunk boundaries come from the continuation
+    bit, each value is reassembled with one bincount, then zig-zag decoded and
+    cumulatively summed into coordinates.
+    """
+    if not encoded:
+        return np.empty((0, 2))
+    chars = np.frombuffer(encoded.encode("ascii"), dtype=np.uint8).astype(np.int64) - 63
+    ends = (chars & 0x20) == 0
+    chunk = np.concatenate([[0], np.cumsum(ends)[:-1]])
+    starts = np.concatenate([[0], np.flatnonzero(ends)[:-1] + 1])
+    position = np.arange(len(chars)) - starts[chunk]
+    values = np.bincount(chunk, weights=(chars & 0x1f) << (5 * position)).astype(np.int64)
+    values = np.where(values & 1, ~(values >> 1), values >> 1)
+    if len(values) % 2:
+        values = values[:-1]  # Truncated polyline: drop the dangling latitude
+    lat_lng = np.cumsum(values.reshape(-1, 2), axis=0) / 10 ** precision
+    return lat_lng[:, ::-1]
+
+
+def route_key(origin: tuple, dest: tuple, bucket: Optional[str] = None) -> bytes:
+    """16-byte key of both endpoints in microdegrees, plus the departure bucket."""
+    coords = np.round(np.array([origin[0], origin[1], dest[0], dest[1]], dtype=float) * 1e6)
+    return coords.astype(np.int32).tobytes() + (bucket or "").encode("ascii")
+
+
+class RouteCache:
+    """
+    Route durations and distances in one growable structured array.
+
+    Keys map to row numbers; the values themselves live unboxed in ROUTE_DTYPE
+    rows, so a cache of thousands of routes stays a few hundred kilobytes.
+    Encoded geometries sit in a side table by row, and copies may leave them out.
+    """
+
+    __slots__ = ('_index', '_rows', '_size', '_geometry')
+
+    def __init__(self, capacity: int = 64):
+        self._index: Dict[bytes, int] = {}
+        self._rows = np.zeros(capacity, dtype=ROUTE_DTYPE)
+        self._size = 0
+        self._geometry: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._index)
+
+    def get(self, key: bytes) -> Optional[Route]:
+        """Cached route for key, None when missing."""
+        i = self._index.get(key)
+        if i is None:
+            return None
+        row = self._rows[i]
+        return Route(int(row['duration_s']), int(row['distance_m']), self._geometry.get(i, ""))
+
+    def seconds(self, key: bytes) -> int:
+        """Cached duration for key; raises KeyError when missing."""
+        return int(self._rows['duration_s'][self._index[key]])
+
+    def put(self, key: bytes, route: Route) -> None:
+        """Store or overwrite the route for key."""
+        i = self._index.get(key)
+        if i is None:
+            if self._size == len(self._rows):
+                self._rows = np.resize(self._rows, 2 * len(self._rows))
+            i = self._index[key] = self._size
+            self._size += 1
+        self._rows[i] = (route.duration_s, route.distance_m)
+        if route.geometry:
+            self._geometry[i] = route.geometry
+        else:
+            self._geometry.pop(i, None)
+
+    def update(self, other: Union["RouteCache", Dict[bytes, Route]]) -> None:
+        """Copy every route from another cache (or a key -> Route mapping)."""
+        if isinstance(other, RouteCache):
+            for key in other:
+                self.put(key, other.get(key))
+        else:
+            for key, route in other.items():
+                self.put(key, route)
+
+    def samples(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Every cached route as arrays: endpoints (n, 4) as origin lat/lng then
+        destination lat/lng in degrees, duration seconds and distance metres.
+        """
+        keys = b"".join(key[:16] for key in self._index)
+        endpoints = np.frombuffer(keys, dtype=np.int32).reshape(-1, 4) / 1e6
+        rows = self._rows[list(self._index.values())]
+        return endpoints, rows['duration_s'].astype(float), rows['distance_m'].astype(float)
+
+    def copy(self, with_geometry: bool = True, keep_geometry: Iterable[bytes] = ()) -> "RouteCache":
+        """
+        Copy of the cache; with_geometry=False keeps only times and distances,
+        except for the routes keyed in keep_geometry.
+        """
+        clone = RouteCache(max(1, self._size))
+        clone._index = dict(self._index)
+        clone._rows[:self._size] = self._rows[:self._size]
+        clone._size = self._size
+        if with_geometry:
+            clone._geometry = dict(self._geometry)
+        else:
+            for key in keep_geometry:
+                i = self._index.get(key)
+                if i in self._geometry:
+                    clone._geometry[i] = self._geometry[i]
+        return clone
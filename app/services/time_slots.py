@@ -0,0 +1,112 @@
+"""Score candidate meeting points across several proposed departure times."""
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .meeting_optimizer import (
+    LARGE_GROUP_CLUSTERS,
+    MAX_API_CALLS,
+    CancellationToken,
+    OptimizationRun,
+    available_api_calls,
+    departure_bucket,
+    route_matrix,
+    search_members
+)
+from .objectives import DEFAULT_OBJECTIVE, get_objective
+
+
+def score_time_slots(dataset: pd.DataFrame, candidates: List[tuple], slots: List[datetime],
+                     objective: str = DEFAULT_OBJECTIVE,
+                     deadline: Optional[float] = None,
+                     cancel_token: Optional[CancellationToken] = None,
+                     objective_params: Optional[dict] = None) -> dict:
+    """
+    Score every candidate point for every proposed departure slot in one run.
+
+    Slots in the same departure bucket (see DEPARTURE_BUCKET_HOURS) share one
+    candidates×members travel-time matrix, so only distinct buckets cost
+    routing calls. The run gets MAX_API_CALLS per distinct bucket and only
+    routes as many candidates as fit in that budget.
+
+    Args:
+        dataset: DataFrame with user_id, lat and lng columns
+        candidates: (lat, lng) points to compare, most promising first
+        slots: Proposed departure datetimes
+        objective: Name of a fairness objective in app.services.objectives
+        deadline: Optional time.monotonic() value after which no new routing
+            calls are issued; slots whose bucket was not routed get no scores
+        cancel_token: Optional CancellationToken with the same effect
+        objective_params: Parameters for the objective, e.g. {'cap_min': 40}
+
+    Returns:
+        Dict with one entry per slot under 'slots' (departure_time, bucket,
+        scores, best_point, best_score, max_time, avg_time_min), 'best_slot'
+        (index of the fairest slot, None if nothing was routed),
+        'candidate_points', 'time_matrices' keyed by bucket, 'n_api_calls'
+        and 'truncated'
+    """
+    get_objective(objective)  # Fail fast on an unknown objective name
+    run = OptimizationRun(deadline, cancel_token, objective, objective_params)
+
+    buckets = list(dict.fromkeys(departure_bucket(slot) for slot in slots))
+
+    print(f"🕒 TIME-SLOT COMPARISON ({len(slots)} slots, {len(buckets)} buckets)")
+    print("=" * 60)
+
+    # Large groups are scored against weighted representatives
+    search_dataset, _ = search_members(dataset, run, LARGE_GROUP_CLUSTERS, route_every_member=False)
+    n_search = len(search_dataset)
+
+    run.max_api_calls = available_api_calls(MAX_API_CALLS * len(buckets))
+    candidates = list(candidates)[:max(1, run.max_api_calls // len(buckets) // n_search)]
+
+    # One travel-time matrix per bucket, routed at the bucket's first slot
+    matrices: Dict[str, np.ndarray] = {}
+    truncated = False
+    for slot in slots:
+        bucket = departure_bucket(slot)
+        if bucket in matrices:
+            continue
+        run.departure_time = slot
+        matrix, truncated = route_matrix(candidates, search_dataset, run)
+        if truncated:
+            print(f"⏱️ Deadline, cancellation or API budget stopped the search after {len(matrices)} bucket(s)")
+            break
+        matrices[bucket] = matrix
+        print(f"   {bucket}: {len(candidates)} candidates routed ({run.api_calls} API calls)")
+
+    results = []
+    for slot in slots:
+        bucket = departure_bucket(slot)
+        entry = {'departure_time': slot, 'bucket': bucket, 'scores': None,
+                 'best_point': None, 'best_score': None, 'max_time': None, 'avg_time_min': None}
+        matrix = matrices.get(bucket)
+        if matrix is not None:
+            scores = run.score(matrix, search_dataset)
+            best = int(np.argmin(scores))
+            entry.update({
+                'scores': scores,
+                'best_point': candidates[best],
+                'best_score': float(scores[best]),
+                'max_time': float(matrix[best].max()),
+                'avg_time_min': float(np.average(matrix[best], weights=search_dataset.get('weight')))
+            })
+        results.append(entry)
+
+    scored = [i for i, entry in enumerate(results) if entry['best_score'] is not None]
+    best_slot = min(scored, key=lambda i: results[i]['best_score']) if scored else None
+    if best_slot is not None:
+        print(f"✅ Fairest slot: {results[best_slot]['departure_time']:%a %H:%M} "
+              f"(score {results[best_slot]['best_score']:.1f}), {run.api_calls} API calls")
+
+    return {
+        'slots': results,
+        'best_slot': best_slot,
+        'objective': objective,
+        'candidate_points': candidates,
+        'time_matrices': matrices,
+        'n_api_calls': run.api_calls,
+        'truncated': truncated
+    }
@@ -1,6 +1,6 @@
 """UI components and utilities for Social Compass application."""
 from .styles import CUSTOM_CSS
-from .map_utils import create_colored_map
+from .map_utils import build_map_points, cached_colored_map, create_colored_map, create_points_map, points_from_arrays
 
-__all__ = ['CUSTOM_CSS', 'create_colored_map']
+__all__ = ['CUSTOM_CSS', 'create_colored_map', 'cached_colored_map', 'create_points_map', 'build_map_points', 'points_from_arrays']
 
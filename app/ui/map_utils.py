@@ -1,6 +1,14 @@
 """Map utilities for creating colored visualizations."""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Sequence, Tuple, Any
+
+from app.services.routes import decode_polyline
 
 try:
     import pydeck as pdk
@@ -10,170 +18,233 @@ except ImportError:
     pdk = None
 
 
-def create_colored_map(
-    member_data: List[Dict],
-    meeting_point: Tuple[float, float],
-    places: Optional[List[Dict]] = None
-) -> Optional[Any]:
+# Color palette for people (distinct colors - NOT red)
+PERSON_COLORS = np.array([
+    [99, 102, 241],   # Indigo #6366f1
+    [139, 92, 246],   # Purple #8b5cf6
+    [59, 130, 246],   # Blue #3b82f6
+    [16, 185, 129],   # Green #10b981
+    [245, 158, 11],   # Yellow/Amber #f59e0b
+    [236, 72, 153],   # Pink #ec4899
+    [14, 165, 233],   # Sky Blue #0ea5e9
+    [168, 85, 247],   # Violet #a855f7
+])
+
+# Meeting point color (bright orange/gold - distinct from people)
+MEETING_COLOR = [245, 158, 11, 255]  # Amber/Orange #f59e0b
+
+# Restaurant/Places color (green)
+PLACE_COLOR = [16, 185, 129, 200]  # Green #10b981 with alpha
+
+# Marker sizes per category: (radius m, min px, max px)
+CATEGORY_STYLES = {
+    'member': (250, 8, 15),
+    'meeting': (350, 12, 20),
+    'place': (200, 6, 12),
+}
+
+# Categories with more points than this are binned into cells before sending
+AGGREGATION_THRESHOLD = 1000
+AGGREGATION_CELL_M = 300
+
+# Serialized decks kept across reruns, least recently used evicted first
+MAX_CACHED_DECKS = 32
+
+
+def _first_coordinate(frame: pd.DataFrame, columns: Sequence[str]) -> pd.Series:
+    """First non-zero numeric value across candidate coordinate columns, NaN if none."""
+    values = pd.Series(np.nan, index=frame.index)
+    for column in columns:
+        if column in frame.columns:
+            parsed = pd.to_numeric(frame[column], errors='coerce').replace(0, np.nan)
+            values = values.fillna(parsed)
+    return values
+
+
+def points_from_arrays(lat: np.ndarray, lon: np.ndarray, category: str,
+                       names: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Points frame for create_points_map straight from coordinate arrays of one category."""
+    lat = np.asarray(lat, dtype=float)
+    n = len(lat)
+    if category == 'member':
+        colors = np.hstack([PERSON_COLORS[np.arange(n) % len(PERSON_COLORS)], np.full((n, 1), 200)]).tolist()
+    else:
+        colors = [MEETING_COLOR if category == 'meeting' else PLACE_COLOR] * n
+    return pd.DataFrame({
+        'lat': lat,
+        'lon': np.asarray(lon, dtype=float),
+        'name': list(names) if names is not None else [category.title()] * n,
+        'category': category,
+        'color_rgba': colors
+    })
+
+
+def build_map_points(member_data: Optional[List[Dict]] = None,
+                     meeting_point: Optional[Tuple[float, float]] = None,
+                     places: Optional[List[Dict]] = None) -> pd.DataFrame:
     """
-    Create a pydeck map with colored markers:
-    - Each person gets a unique color
-    - Meeting point gets a specific color (red/pink)
-    - Restaurants get another color (green/orange)
+    Collect members, the meeting point and places into one frame with
+    lat, lon, name, category and color_rgba columns. Colors are assigned
+    column-wise: members cycle through PERSON_COLORS in order.
     """
-    if not PYDECK_AVAILABLE:
-        return None
-    
-    # Color palette for people (distinct colors - NOT red)
-    person_colors = [
-        [99, 102, 241],   # Indigo #6366f1
-        [139, 92, 246],   # Purple #8b5cf6
-        [59, 130, 246],   # Blue #3b82f6
-        [16, 185, 129],   # Green #10b981
-        [245, 158, 11],   # Yellow/Amber #f59e0b
-        [236, 72, 153],   # Pink #ec4899
-        [14, 165, 233],   # Sky Blue #0ea5e9
-        [168, 85, 247],   # Violet #a855f7
-    ]
-    
-    # Meeting point color (bright orange/gold - distinct from people)
-    meeting_color = [245, 158, 11, 255]  # Amber/Orange #f59e0b - distinct meeting point
-    
-    # Restaurant/Places color (green)
-    restaurant_color = [16, 185, 129, 200]  # Green #10b981 with alpha
-    
-    layers = []
-    
-    # Add person markers with unique colors
+    frames = []
+
     if member_data:
-        person_points = []
-        for idx, member in enumerate(member_data):
-            color = person_colors[idx % len(person_colors)]
-            # Ensure color has 4 elements [R, G, B, A]
-            if len(color) == 3:
-                color = color + [200]  # Add alpha
-            person_points.append({
-                'lat': member['lat'],
-                'lon': member['lng'],
-                'name': member['user_id'],
-                'color_rgba': color
-            })
-        
-        if person_points:
-            person_df = pd.DataFrame(person_points)
-            person_layer = pdk.Layer(
+        members = pd.DataFrame(member_data)
+        frames.append(points_from_arrays(members['lat'].values, members['lng'].values,
+                                         'member', members['user_id'].values))
+
+    if meeting_point:
+        frames.append(points_from_arrays([meeting_point[0]], [meeting_point[1]],
+                                         'meeting', ['Meeting Point']))
+
+    if places:
+        raw = pd.DataFrame(places)
+        # Try different possible coordinate field names
+        place_frame = pd.DataFrame({
+            'lat': _first_coordinate(raw, ['latitude', 'lat']),
+            'lon': _first_coordinate(raw, ['longitude', 'lon', 'lng']),
+            'name': raw['name'].fillna('Place') if 'name' in raw.columns else 'Place',
+            'category': 'place'
+        }).dropna(subset=['lat', 'lon'])
+        place_frame['color_rgba'] = [PLACE_COLOR] * len(place_frame)
+        frames.append(place_frame)
+
+    if not frames:
+        return pd.DataFrame(columns=['lat', 'lon', 'name', 'category', 'color_rgba'])
+    return pd.concat(frames, ignore_index=True)
+
+
+def _aggregate_points(subset: pd.DataFrame, category: str) -> pd.DataFrame:
+    """Bin points into ~AGGREGATION_CELL_M cells: one marker per cell at its centroid, sized by count."""
+    cell_deg = AGGREGATION_CELL_M / 111320
+    cells = np.floor(subset[['lat', 'lon']].values / cell_deg).astype(np.int64)
+    _, inverse, counts = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+    inverse = inverse.ravel()
+    color = subset['color_rgba'].iloc[0]
+    return pd.DataFrame({
+        'lat': np.bincount(inverse, weights=subset['lat'].values) / counts,
+        'lon': np.bincount(inverse, weights=subset['lon'].values) / counts,
+        'name': [f"{count} {category}s" for count in counts],
+        'radius': AGGREGATION_CELL_M * np.sqrt(counts / counts.max()),
+        'color_rgba': [color] * len(counts)
+    })
+
+
+def _point_layers(points: pd.DataFrame) -> List[Any]:
+    """One layer per category: scatter markers, binned first for very large categories."""
+    layers = []
+    for category in ('place', 'member', 'meeting'):
+        subset = points[points['category'] == category]
+        if subset.empty:
+            continue
+        if len(subset) > AGGREGATION_THRESHOLD and category != 'meeting':
+            layers.append(pdk.Layer(
                 'ScatterplotLayer',
-                data=person_df,
+                data=_aggregate_points(subset, category),
                 get_position='[lon, lat]',
                 get_fill_color='color_rgba',
-                get_radius=250,
+                get_radius='radius',
                 pickable=True,
-                radius_min_pixels=8,
-                radius_max_pixels=15,
-            )
-            layers.append(person_layer)
-    
-    # Add meeting point marker (orange/amber - distinct)
-    if meeting_point:
-        meeting_df = pd.DataFrame([{
-            'lat': meeting_point[0],
-            'lon': meeting_point[1],
-            'name': 'Meeting Point',
-            'color_rgba': meeting_color
-        }])
-        meeting_layer = pdk.Layer(
+                radius_min_pixels=4,
+            ))
+            continue
+        radius, min_pixels, max_pixels = CATEGORY_STYLES.get(category, CATEGORY_STYLES['place'])
+        layers.append(pdk.Layer(
             'ScatterplotLayer',
-            data=meeting_df,
+            data=subset[['lat', 'lon', 'name', 'color_rgba']],
             get_position='[lon, lat]',
             get_fill_color='color_rgba',
-            get_radius=350,
+            get_radius=radius,
             pickable=True,
-            radius_min_pixels=12,
-            radius_max_pixels=20,
-        )
-        layers.append(meeting_layer)
-    
-    # Add restaurant/place markers
-    if places:
-        restaurant_points = []
-        for place in places:
-            try:
-                # Try different possible coordinate field names
-                lat = place.get('latitude') or place.get('lat')
-                lng = place.get('longitude') or place.get('lon') or place.get('lng')
-                
-                # Convert to float if they're strings
-                if lat:
-                    lat = float(lat)
-                if lng:
-                    lng = float(lng)
-                
-                # Only add if we have valid coordinates
-                if lat and lng and lat != 0 and lng != 0:
-                    restaurant_points.append({
-                        'lat': lat,
-                        'lon': lng,
-                        'name': place.get('name', 'Place'),
-                        'color_rgba': restaurant_color
-                    })
-            except (ValueError, TypeError):
-                continue
-        
-        if restaurant_points:
-            restaurant_df = pd.DataFrame(restaurant_points)
-            restaurant_layer = pdk.Layer(
-                'ScatterplotLayer',
-                data=restaurant_df,
-                get_position='[lon, lat]',
-                get_fill_color='color_rgba',
-                get_radius=200,
-                pickable=True,
-                radius_min_pixels=6,
-                radius_max_pixels=12,
-            )
-            layers.append(restaurant_layer)
-    
-    # Calculate center point
-    all_lats = []
-    all_lngs = []
-    if member_data:
-        all_lats.extend([m['lat'] for m in member_data])
-        all_lngs.extend([m['lng'] for m in member_data])
-    if meeting_point:
-        all_lats.append(meeting_point[0])
-        all_lngs.append(meeting_point[1])
-    if places:
-        for place in places:
-            try:
-                # Try different possible coordinate field names
-                lat = place.get('latitude') or place.get('lat')
-                lng = place.get('longitude') or place.get('lon') or place.get('lng')
-                
-                if lat and lng:
-                    lat = float(lat)
-                    lng = float(lng)
-                    if lat != 0 and lng != 0:
-                        all_lats.append(lat)
-                        all_lngs.append(lng)
-            except (ValueError, TypeError):
-                pass
-    
-    if all_lats and all_lngs:
-        center_lat = sum(all_lats) / len(all_lats)
-        center_lon = sum(all_lngs) / len(all_lngs)
-    else:
+            radius_min_pixels=min_pixels,
+            radius_max_pixels=max_pixels,
+        ))
+    return layers
+
+
+def _heatmap_layer(heatmap: Dict) -> Optional[Any]:
+    """Fairness heatmap: weight 1 at the fairest grid point, 0 at the worst."""
+    relative = np.asarray(heatmap['relative'], dtype=float)
+    if not len(relative):
+        return None
+    spread = relative.max() or 1.0
+    heat_df = pd.DataFrame({
+        'lat': heatmap['lat'],
+        'lon': heatmap['lng'],
+        'weight': 1 - relative / spread
+    })
+    return pdk.Layer(
+        'HeatmapLayer',
+        data=heat_df,
+        get_position='[lon, lat]',
+        get_weight='weight',
+        radius_pixels=40,
+        opacity=0.5,
+    )
+
+
+def _route_layer(member_points: pd.DataFrame, routes: List[str]) -> Optional[Any]:
+    """Each member's route as a path in the member's color."""
+    route_paths = []
+    for (_, member), encoded in zip(member_points.iterrows(), routes):
+        path = decode_polyline(encoded)
+        if len(path) < 2:
+            continue
+        route_paths.append({
+            'name': member['name'],
+            'path': path.tolist(),
+            'color_rgba': list(member['color_rgba'][:3]) + [160]
+        })
+    if not route_paths:
         return None
-    
+    return pdk.Layer(
+        'PathLayer',
+        data=pd.DataFrame(route_paths),
+        get_path='path',
+        get_color='color_rgba',
+        width_scale=1,
+        width_min_pixels=3,
+        pickable=True,
+    )
+
+
+def create_points_map(points: pd.DataFrame,
+                      routes: Optional[List[str]] = None,
+                      heatmap: Optional[Dict] = None) -> Optional[Any]:
+    """
+    Columnar rendering path: build a deck from one frame of points.
+
+    points needs lat, lon, name, category ('member', 'meeting' or 'place') and
+    color_rgba columns, as produced by build_map_points. Categories above
+    AGGREGATION_THRESHOLD points are aggregated so the payload stays small.
+    """
+    if not PYDECK_AVAILABLE:
+        return None
+
+    layers = []
+    if heatmap is not None:
+        heat_layer = _heatmap_layer(heatmap)
+        if heat_layer is not None:
+            layers.append(heat_layer)
+    if routes:
+        route_layer = _route_layer(points[points['category'] == 'member'], routes)
+        if route_layer is not None:
+            layers.append(route_layer)
+    layers.extend(_point_layers(points))
+
+    if points.empty:
+        return None
+
     # Create the map
     view_state = pdk.ViewState(
-        latitude=center_lat,
-        longitude=center_lon,
+        latitude=float(points['lat'].mean()),
+        longitude=float(points['lon'].mean()),
         zoom=12,
         pitch=0
     )
-    
+
     # Use a map style that's easier to see
-    # Try light style first, fallback to dark if needed
     deck = pdk.Deck(
         map_style='mapbox://styles/mapbox/streets-v12',  # Streets style for better visibility
         initial_view_state=view_state,
@@ -182,6 +253,92 @@ def create_colored_map(
             'text': '{name}'
         }
     )
-    
+
     return deck
 
+
+def create_colored_map(
+    member_data: List[Dict],
+    meeting_point: Tuple[float, float],
+    places: Optional[List[Dict]] = None,
+    routes: Optional[List[str]] = None,
+    heatmap: Optional[Dict] = None
+) -> Optional[Any]:
+    """
+    Create a pydeck map with colored markers:
+    - Each person gets a unique color
+    - Meeting point gets a specific color (red/pink)
+    - Restaurants get another color (green/orange)
+    - Optional routes (encoded polylines, one per member) are drawn as paths
+      in the member's color
+    - Optional heatmap (a fairness surface with 'lat', 'lng' and 'relative'
+      arrays) glows hottest where meeting is fairest
+    """
+    if not PYDECK_AVAILABLE:
+        return None
+    points = build_map_points(member_data, meeting_point, places)
+    return create_points_map(points, routes=routes, heatmap=heatmap)
+
+
+class SerializedDeck:
+    """
+    A deck already serialized to JSON. st.pydeck_chart only needs to_json() and
+    the tooltip, so cached decks render without being rebuilt or re-serialized.
+    """
+
+    __slots__ = ('_json', '_tooltip', 'layers', 'mapbox_key', 'width')
+
+    def __init__(self, deck: Any):
+        self._json = deck.to_json()
+        self._tooltip = getattr(deck, '_tooltip', None)
+        self.layers = None  # Data already lives in the JSON
+        self.mapbox_key = getattr(deck, 'mapbox_key', None)
+        self.width = getattr(deck, 'width', None)
+
+    def to_json(self) -> str:
+        return self._json
+
+
+_deck_cache: "OrderedDict[str, Optional[SerializedDeck]]" = OrderedDict()
+_deck_cache_lock = threading.Lock()
+
+
+def _deck_key(member_data, meeting_point, places, routes, heatmap) -> str:
+    """Hash of everything that changes what create_colored_map draws."""
+    digest = hashlib.sha1()
+    members = [(m.get('user_id'), m.get('lat'), m.get('lng')) for m in member_data or []]
+    digest.update(json.dumps([members, meeting_point, places, routes],
+                             sort_keys=True, default=str).encode("utf-8"))
+    if heatmap is not None:
+        for column in ('lat', 'lng', 'relative'):
+            digest.update(np.ascontiguousarray(heatmap[column], dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def cached_colored_map(
+    member_data: List[Dict],
+    meeting_point: Tuple[float, float],
+    places: Optional[List[Dict]] = None,
+    routes: Optional[List[str]] = None,
+    heatmap: Optional[Dict] = None
+) -> Optional[SerializedDeck]:
+    """
+    create_colored_map memoized on a hash of its inputs.
+
+    Returns the serialized deck from the LRU cache when the map is unchanged, so
+    a rerun that only touched unrelated widgets skips building and serializing.
+    """
+    key = _deck_key(member_data, meeting_point, places, routes, heatmap)
+    with _deck_cache_lock:
+        if key in _deck_cache:
+            _deck_cache.move_to_end(key)
+            return _deck_cache[key]
+
+    deck = create_colored_map(member_data, meeting_point, places, routes=routes, heatmap=heatmap)
+    serialized = SerializedDeck(deck) if deck is not None else None
+
+    with _deck_cache_lock:
+        _deck_cache[key] = serialized
+        while len(_deck_cache) > MAX_CACHED_DECKS:
+            _deck_cache.popitem(last=False)
+    return serialized
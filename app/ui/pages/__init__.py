@@ -5,7 +5,7 @@ from .onboarding import render_onboarding
 from .dashboard import render_dashboard
 from .profile import render_profile
 from .groups import render_groups
-from .find_meeting import render_find_meeting
+from .find_meeting import render_find_meeting, cancel_meeting_optimization
 
 __all__ = [
     'render_landing_page',
@@ -14,6 +14,7 @@ __all__ = [
     'render_dashboard',
     'render_profile',
     'render_groups',
-    'render_find_meeting'
+    'render_find_meeting',
+    'cancel_meeting_optimization'
 ]
 
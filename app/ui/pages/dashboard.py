@@ -9,9 +9,7 @@ def render_dashboard():
     accounts_repo = AccountsRepository()
     groups_repo = GroupsRepository()
     
-    accounts = accounts_repo.load_all()
-    groups = groups_repo.load_all()
-    user = accounts.get(st.session_state.user_email, {})
+    user = accounts_repo.get(st.session_state.user_email) or {}
     
     st.markdown(f'<h1 class="hero-title">Welcome back, {user.get("name", "Friend")}! 🧭</h1>', unsafe_allow_html=True)
     
@@ -28,7 +26,7 @@ def render_dashboard():
     with col2:
         st.markdown(f"""
         <div class="metric-card">
-            <div class="stat-number">{len(accounts)}</div>
+            <div class="stat-number">{accounts_repo.count()}</div>
             <p>Community Members</p>
         </div>
         """, unsafe_allow_html=True)
@@ -64,7 +62,7 @@ def render_dashboard():
         st.markdown("### 👥 Your Groups")
         if user_groups:
             for group_name in list(user_groups.keys())[:5]:
-                group_data = groups[group_name]
+                group_data = user_groups[group_name]
                 member_count = len(group_data.get("members", []))
                 st.markdown(f"""
                 <div class="group-card">
@@ -1,10 +1,317 @@
 """Find meeting point page component."""
+import uuid
 import streamlit as st
 import pandas as pd
-from app.services.meeting_optimizer import compute_equal_time_location
+from app.services.optimization_jobs import OptimizationJob, get_job_key, get_job_runner, get_member_hash
 from app.services.finding_places import find_places_by_category
-from app.data import AccountsRepository, GroupsRepository
-from app.ui import create_colored_map
+from app.services.fairness_heatmap import get_fairness_surface
+from app.services.meeting_result import MeetingResult
+from app.data import AccountsRepository, GroupsRepository, MeetingResultsRepository
+from app.ui import cached_colored_map
+
+# Wall-time budget for one optimization run (find-meeting latency SLO)
+OPTIMIZATION_TIME_BUDGET_S = 20
+
+# Meeting modes offered on the page, see compute_equal_time_location
+MEETING_MODE_LABELS = {
+    'equal_time': "🎯 One fair point",
+    'k_points': "👥 Split into two meeting points",
+    'hub': "🚇 Meet at a metro station or mall",
+}
+
+
+def _session_id() -> str:
+    """Stable id for this browser session, used as the job owner."""
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    return st.session_state.session_id
+
+
+def cancel_meeting_optimization():
+    """Stop waiting on this session's optimization; it is cancelled if no other session needs it."""
+    job_key = st.session_state.pop("meeting_job_key", None)
+    if job_key is not None:
+        get_job_runner().release(job_key, _session_id())
+
+
+def _store_result(group_name: str, result_key: str, member_data: list, job_result: dict):
+    """Keep a finished result in session state and share it with the group's other sessions."""
+    result = MeetingResult.from_result(job_result)
+    st.session_state[result_key] = result
+    MeetingResultsRepository().save(group_name, get_member_hash(pd.DataFrame(member_data)), result)
+
+
+def _adopt_warm_job(group_name: str, result_key: str, member_data: list, mode: str):
+    """
+    Reuse a job already started for this exact member set (e.g. by precompute).
+    
+    A finished result is copied into session state; a running job is joined and
+    its key returned so the caller can poll it.
+    """
+    dataset = pd.DataFrame(member_data)
+    runner = get_job_runner()
+    job = runner.get(get_job_key(group_name, dataset, mode))
+    if job is None or job.status not in (OptimizationJob.DONE, OptimizationJob.QUEUED, OptimizationJob.RUNNING):
+        return None
+    
+    if job.status == OptimizationJob.DONE:
+        _store_result(group_name, result_key, member_data, job.result)
+        return None
+    
+    runner.submit(group_name, dataset, owner=_session_id(), mode=mode)
+    st.session_state.meeting_job_key = job.key
+    return job.key
+
+
+@st.fragment(run_every=1)
+def _render_job_progress(group_name: str, result_key: str, job_key: str, member_data: list):
+    """Poll the background optimization and move its result into session state when done."""
+    job = get_job_runner().get(job_key)
+    
+    if job is None or job.status == OptimizationJob.CANCELLED:
+        st.session_state.pop("meeting_job_key", None)
+        st.rerun()
+    
+    if job.status == OptimizationJob.FAILED:
+        st.session_state.pop("meeting_job_key", None)
+        st.session_state[f"{result_key}_error"] = job.error
+        st.rerun()
+    
+    if job.status == OptimizationJob.DONE:
+        st.session_state.pop("meeting_job_key", None)
+        _store_result(group_name, result_key, member_data, job.result)
+        st.rerun()
+    
+    event = job.progress
+    if event is None:
+        waiting = job.status == OptimizationJob.QUEUED
+        st.progress(0.0, text="🔍 Waiting for a free optimizer..." if waiting else "🔍 Searching...")
+        return
+    
+    # Show the intermediate best point while the search runs in the background
+    phase_label = "Scanning region" if event['phase'] == 'phase1' else "Refining"
+    st.progress(
+        min(1.0, event['n_api_calls'] / max(1, event['max_api_calls'])),
+        text=f"🔍 {phase_label}... best score so far {event['best_score']:.0f} "
+             f"({event['n_api_calls']}/{event['max_api_calls']} API calls)"
+    )
+    # The best point repeats across polls, so most ticks hit the deck cache
+    live_deck = cached_colored_map(
+        member_data=member_data,
+        meeting_point=event['best_point']
+    )
+    if live_deck:
+        st.pydeck_chart(live_deck)
+
+
+@st.fragment
+def _render_result_panel(selected_group: str, result_key: str, result: MeetingResult):
+    """Metrics, result map and legend; the heatmap toggle reruns only this fragment."""
+    st.markdown("## 🎯 Optimal Meeting Point Found!")
+    if result.truncated:
+        st.info("⏱️ The search hit its time or API limit, so this is the best point found so far. Recalculate to search again.")
+        if result.unrouted_members:
+            st.caption(f"⚠️ No route was checked for {', '.join(result.unrouted_members)}; "
+                       f"their travel times are placeholders.")
+    
+    equal_point = result.equal_point
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="stat-number">{result.avg_time_min:.0f}</div>
+            <p>Avg. Travel (min)</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="stat-number">{result.equality_score:.1f}</div>
+            <p>Fairness Score</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="stat-number">{result.time_spread:.0f}</div>
+            <p>Time Spread (min)</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("### 📍 Optimal Meeting Point")
+    
+    # Get places if they exist
+    places_key = f"found_places_{result_key}"
+    places_for_map = st.session_state.get(places_key) if places_key in st.session_state else None
+    
+    # Fairness surface from travel times estimated off this result's routes
+    surface = None
+    if st.toggle("🌡️ Show fairness heatmap", key=f"heatmap_{result_key}",
+                 help="Estimated fairness of meeting anywhere in the area; hotter is fairer"):
+        surface = get_fairness_surface(selected_group, result.dataset,
+                                       route_cache=result.route_cache,
+                                       objective=result.objective)
+    
+    # Create colored map (served from the deck cache when nothing changed)
+    colored_map = cached_colored_map(
+        member_data=result.member_data,
+        meeting_point=equal_point,
+        places=places_for_map,
+        routes=result.route_geometries,
+        heatmap=surface
+    )
+    
+    if colored_map:
+        st.pydeck_chart(colored_map)
+    else:
+        # Fallback to simple map if pydeck fails
+        all_lats = result.lats.tolist() + [equal_point[0]]
+        all_lngs = result.lngs.tolist() + [equal_point[1]]
+        map_data = pd.DataFrame({
+            'lat': all_lats,
+            'lon': all_lngs
+        })
+        st.map(map_data, zoom=12)
+    
+    # Legend
+    st.markdown("""
+    <div style="background: rgba(255, 255, 255, 0.05); padding: 1rem; border-radius: 10px; margin: 1rem 0;">
+        <strong>Map Legend:</strong><br>
+        <span style="color: #f59e0b;">🟠 Orange/Amber</span> = Meeting Point<br>
+        <span style="color: #10b981;">🟢 Green</span> = Restaurants/Places<br>
+        <span style="color: #6366f1;">🔵 Various Colors</span> = Group Members (each person has a unique color)<br>
+        <span style="color: #6366f1;">〰️ Lines</span> = Each member's route to the meeting point
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown(f"""
+    **Coordinates:** {equal_point[0]:.6f}, {equal_point[1]:.6f}
+    
+    *The orange marker shows the optimal meeting point that minimizes travel inequality!*
+    """)
+
+
+@st.fragment
+def _render_alternatives(result: MeetingResult):
+    """Alternative meeting spots and their map."""
+    # Display alternative meeting spots
+    spots = result.alternative_spots[:3]
+    if len(spots):
+        st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
+        if result.mode == 'k_points':
+            st.markdown("### 👥 Other Meeting Points")
+            st.markdown("*The group is split; members closer to these points meet here instead:*")
+        else:
+            st.markdown("### 🗺️ Alternative Meeting Spots")
+            st.markdown("*Other fair locations nearby if the optimal point doesn't work for your group:*")
+        
+        alt_cols = st.columns(len(spots))
+        for idx, alt_spot in enumerate(spots):
+            with alt_cols[idx]:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <small>📍 Option {idx+1}</small><br>
+                    <div style="font-size: 0.9rem; margin: 0.5rem 0;">
+                        <strong>{alt_spot['avg_time']:.0f}</strong> min avg<br>
+                        <strong>{alt_spot['equality_score']:.1f}</strong> fairness
+                    </div>
+                    <small>{alt_spot['lat']:.4f}, {alt_spot['lng']:.4f}</small>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Map of alternatives
+        alt_lats = result.lats.tolist() + spots['lat'].tolist()
+        alt_lngs = result.lngs.tolist() + spots['lng'].tolist()
+        
+        alt_map_data = pd.DataFrame({
+            'lat': alt_lats,
+            'lon': alt_lngs
+        })
+        st.map(alt_map_data, zoom=12)
+
+
+def _render_travel_times(result: MeetingResult):
+    """Per-member travel times at the chosen point."""
+    st.markdown("### 👥 Individual Travel Times")
+    for user_id, travel_time in zip(result.user_ids.tolist(), result.travel_times_min.tolist()):
+        deviation = travel_time - result.avg_time_min
+        color = "green" if abs(deviation) < 5 else "orange" if abs(deviation) < 10 else "red"
+        st.markdown(f"""
+        <div class="member-card" style="border-left-color: {color};">
+            <strong>{user_id}</strong><br>
+            <span style="font-size: 1.2rem;">{travel_time:.0f} minutes</span>
+            <small>({'+' if deviation > 0 else ''}{deviation:.0f} from avg)</small>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+@st.fragment
+def _render_places_search(result_key: str, result: MeetingResult):
+    """
+    Nearby places search. Picking a category reruns only this fragment; a new
+    search reruns the page so the result map shows the places.
+    """
+    # --- FIND NEARBY PLACES ---
+    st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
+    st.markdown("### 🍽️ Nearby Places to Meet")
+    
+    # Initialize session state for places
+    places_key = f"found_places_{result_key}"
+    if places_key not in st.session_state:
+        st.session_state[places_key] = None
+        st.session_state[f"{places_key}_category"] = None
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        place_category = st.selectbox("What are you looking for?", 
+            ["Restaurant", "Coffee", "Park", "Bar", "Cafe"], 
+            key=f"place_search_{result_key}")
+    with col2:
+        if st.session_state[places_key]:
+            if st.button("🔄 Reset", key=f"reset_places_{result_key}"):
+                st.session_state[places_key] = None
+                st.session_state[f"{places_key}_category"] = None
+                st.rerun()
+    
+    if st.button("🔍 Find Nearby Places", key=f"find_places_{result_key}"):
+        with st.spinner(f"Finding {place_category.lower()}s near your meeting point..."):
+            try:
+                places = find_places_by_category(result.dataset, category_name=place_category)
+                st.session_state[places_key] = places
+                st.session_state[f"{places_key}_category"] = place_category
+                st.rerun()
+            except Exception as e:
+                st.warning(f"Could not find nearby places. Make sure your LatLong API key is set in credentials.json")
+    
+    # Display stored places if they exist
+    if st.session_state[places_key]:
+        places = st.session_state[places_key]
+        category = st.session_state[f"{places_key}_category"]
+        
+        if places:
+            # Count places with valid coordinates
+            places_with_coords = [p for p in places if p.get('latitude') and p.get('longitude')]
+            st.success(f"✅ Found {len(places)} {category.lower()}(s)! ({len(places_with_coords)} with map coordinates)")
+            for i, place in enumerate(places, 1):
+                full_text = place.get('name', 'Unknown')
+                parts = full_text.split(',', 1)
+                if len(parts) > 1:
+                    display_name = parts[0].strip()
+                    display_addr = parts[1].strip()
+                else:
+                    display_name = full_text
+                    display_addr = "Location details in name"
+                
+                st.markdown(f"""
+                <div class="member-card">
+                    <strong>#{i} {display_name}</strong><br>
+                    <small>📍 {display_addr}</small><br>
+                    <small style="color: #a0a0a0;">Near: {place.get('found_near', 'Meeting point')}</small>
+                </div>
+                """, unsafe_allow_html=True)
+        else:
+            st.info(f"No {category.lower()}s found near your meeting point. Try a different category!")
 
 
 def render_find_meeting():
@@ -12,9 +319,6 @@ def render_find_meeting():
     accounts_repo = AccountsRepository()
     groups_repo = GroupsRepository()
     
-    accounts = accounts_repo.load_all()
-    groups = groups_repo.load_all()
-    
     st.markdown('<h1 class="hero-title">Find Meeting Point 📍</h1>', unsafe_allow_html=True)
     st.markdown('<p class="hero-subtitle">Discover the fairest meeting location for your group</p>', unsafe_allow_html=True)
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
@@ -38,12 +342,10 @@ def render_find_meeting():
     
     # Clear results if group changed
     if hasattr(st.session_state, 'last_selected_group') and st.session_state.last_selected_group != selected_group:
+        cancel_meeting_optimization()
         result_key = f"meeting_result_{st.session_state.last_selected_group}"
         if result_key in st.session_state:
             st.session_state[result_key] = None
-            st.session_state[f"{result_key}_dataset"] = None
-            st.session_state[f"{result_key}_member_lats"] = None
-            st.session_state[f"{result_key}_member_lngs"] = None
             places_key = f"found_places_{result_key}"
             if places_key in st.session_state:
                 st.session_state[places_key] = None
@@ -51,8 +353,9 @@ def render_find_meeting():
     
     st.session_state.last_selected_group = selected_group
     
-    group_data = groups[selected_group]
+    group_data = user_groups[selected_group]
     members = group_data.get("members", [])
+    accounts = accounts_repo.get_many(members)
     
     st.markdown(f"### 👥 Group: {selected_group}")
     st.markdown(f"*{group_data.get('vibe', 'Meeting')} with {len(members)} members*")
@@ -107,222 +410,65 @@ def render_find_meeting():
     if len(member_data) >= 2:
         # Show button only if results haven't been calculated or group changed
         result_key = f"meeting_result_{selected_group}"
+        member_hash = get_member_hash(pd.DataFrame(member_data))
+        
+        # A result computed before a member moved or joined is stale
+        session_result = st.session_state.get(result_key)
+        if session_result is not None and get_member_hash(session_result.dataset) != member_hash:
+            st.session_state[result_key] = None
+        
+        # Reuse a result another member of the group already computed
+        if st.session_state.get(result_key) is None and not st.session_state.get("meeting_job_key"):
+            st.session_state[result_key] = MeetingResultsRepository().get(selected_group, member_hash)
+        
         if result_key not in st.session_state or st.session_state[result_key] is None:
-            if st.button("🎯 Find Optimal Meeting Point", use_container_width=True):
-                with st.spinner("🔍 Analyzing locations and calculating the fairest meeting point..."):
-                    try:
-                        dataset = pd.DataFrame(member_data)
-                        result = compute_equal_time_location(dataset)
-                        
-                        # Store results in session state
-                        st.session_state[result_key] = result
-                        st.session_state[f"{result_key}_dataset"] = dataset
-                        st.session_state[f"{result_key}_member_lats"] = member_lats
-                        st.session_state[f"{result_key}_member_lngs"] = member_lngs
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Error calculating meeting point: {str(e)}")
-                        st.info("Make sure the LATLONG_API_KEY is set in credentials.json")
+            error = st.session_state.get(f"{result_key}_error")
+            if error:
+                st.error(f"Error calculating meeting point: {error}")
+                st.info("Make sure the LATLONG_API_KEY is set in credentials.json")
+            
+            job_key = st.session_state.get("meeting_job_key")
+            mode = st.radio("Meeting style", list(MEETING_MODE_LABELS),
+                            format_func=MEETING_MODE_LABELS.get, horizontal=True,
+                            key=f"meeting_mode_{selected_group}", disabled=bool(job_key))
+            if not job_key:
+                job_key = _adopt_warm_job(selected_group, result_key, member_data, mode)
+            if job_key:
+                _render_job_progress(selected_group, result_key, job_key, member_data)
+            elif st.button("🎯 Find Optimal Meeting Point", use_container_width=True):
+                dataset = pd.DataFrame(member_data)
+                
+                # Only one optimization per session; identical requests from other sessions share the job
+                cancel_meeting_optimization()
+                job = get_job_runner().submit(
+                    selected_group,
+                    dataset,
+                    owner=_session_id(),
+                    time_budget_s=OPTIMIZATION_TIME_BUDGET_S,
+                    mode=mode
+                )
+                st.session_state.meeting_job_key = job.key
+                st.session_state[f"{result_key}_error"] = None
+                st.rerun()
         
         # Display results if they exist in session state
         if result_key in st.session_state and st.session_state[result_key] is not None:
             result = st.session_state[result_key]
-            dataset = st.session_state[f"{result_key}_dataset"]
-            stored_member_lats = st.session_state[f"{result_key}_member_lats"]
-            stored_member_lngs = st.session_state[f"{result_key}_member_lngs"]
             
             # Option to recalculate
             col1, col2 = st.columns([3, 1])
             with col2:
                 if st.button("🔄 Recalculate", key="recalc_meeting"):
+                    get_job_runner().forget(get_job_key(selected_group, result.dataset, result.mode))
+                    MeetingResultsRepository().delete(selected_group)
                     st.session_state[result_key] = None
-                    st.session_state[f"{result_key}_dataset"] = None
-                    st.session_state[f"{result_key}_member_lats"] = None
-                    st.session_state[f"{result_key}_member_lngs"] = None
                     st.rerun()
             
             st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
-            st.markdown("## 🎯 Optimal Meeting Point Found!")
-            
-            equal_point = result['equal_point']
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="stat-number">{result['avg_time_min']:.0f}</div>
-                    <p>Avg. Travel (min)</p>
-                </div>
-                """, unsafe_allow_html=True)
-            with col2:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="stat-number">{result['equality_score']:.1f}</div>
-                    <p>Fairness Score</p>
-                </div>
-                """, unsafe_allow_html=True)
-            with col3:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="stat-number">{result['time_spread']:.0f}</div>
-                    <p>Time Spread (min)</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("### 📍 Optimal Meeting Point")
-            
-            # Reconstruct member_data from stored dataset for the map
-            map_member_data = []
-            if dataset is not None and not dataset.empty:
-                for _, row in dataset.iterrows():
-                    map_member_data.append({
-                        'user_id': row.get('user_id', 'Unknown'),
-                        'lat': row.get('lat'),
-                        'lng': row.get('lng')
-                    })
-            
-            # Get places if they exist
-            places_key = f"found_places_{result_key}"
-            places_for_map = st.session_state.get(places_key) if places_key in st.session_state else None
-            
-            # Create colored map
-            colored_map = create_colored_map(
-                member_data=map_member_data,
-                meeting_point=equal_point,
-                places=places_for_map
-            )
-            
-            if colored_map:
-                st.pydeck_chart(colored_map)
-            else:
-                # Fallback to simple map if pydeck fails
-                all_lats = stored_member_lats + [equal_point[0]]
-                all_lngs = stored_member_lngs + [equal_point[1]]
-                map_data = pd.DataFrame({
-                    'lat': all_lats,
-                    'lon': all_lngs
-                })
-                st.map(map_data, zoom=12)
-            
-            # Legend
-            st.markdown("""
-            <div style="background: rgba(255, 255, 255, 0.05); padding: 1rem; border-radius: 10px; margin: 1rem 0;">
-                <strong>Map Legend:</strong><br>
-                <span style="color: #f59e0b;">🟠 Orange/Amber</span> = Meeting Point<br>
-                <span style="color: #10b981;">🟢 Green</span> = Restaurants/Places<br>
-                <span style="color: #6366f1;">🔵 Various Colors</span> = Group Members (each person has a unique color)
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            **Coordinates:** {equal_point[0]:.6f}, {equal_point[1]:.6f}
-            
-            *The orange marker shows the optimal meeting point that minimizes travel inequality!*
-            """)
-            
-            # Display alternative meeting spots
-            if 'alternative_spots' in result and result['alternative_spots']:
-                st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
-                st.markdown("### 🗺️ Alternative Meeting Spots")
-                st.markdown("*Other fair locations nearby if the optimal point doesn't work for your group:*")
-                
-                alt_cols = st.columns(min(3, len(result['alternative_spots'])))
-                for idx, alt_spot in enumerate(result['alternative_spots'][:3]):
-                    with alt_cols[idx]:
-                        st.markdown(f"""
-                        <div class="metric-card">
-                            <small>📍 Option {idx+1}</small><br>
-                            <div style="font-size: 0.9rem; margin: 0.5rem 0;">
-                                <strong>{alt_spot['avg_time']:.0f}</strong> min avg<br>
-                                <strong>{alt_spot['equality_score']:.1f}</strong> fairness
-                            </div>
-                            <small>{alt_spot['lat']:.4f}, {alt_spot['lng']:.4f}</small>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                # Map of alternatives
-                alt_lats = stored_member_lats + [spot['lat'] for spot in result['alternative_spots'][:3]]
-                alt_lngs = stored_member_lngs + [spot['lng'] for spot in result['alternative_spots'][:3]]
-                
-                alt_map_data = pd.DataFrame({
-                    'lat': alt_lats,
-                    'lon': alt_lngs
-                })
-                st.map(alt_map_data, zoom=12)
-            
-            st.markdown("### 👥 Individual Travel Times")
-            user_times = result['user_times']
-            for _, row in user_times.iterrows():
-                deviation = row['travel_time_min'] - result['avg_time_min']
-                color = "green" if abs(deviation) < 5 else "orange" if abs(deviation) < 10 else "red"
-                st.markdown(f"""
-                <div class="member-card" style="border-left-color: {color};">
-                    <strong>{row['user_id']}</strong><br>
-                    <span style="font-size: 1.2rem;">{row['travel_time_min']:.0f} minutes</span>
-                    <small>({'+' if deviation > 0 else ''}{deviation:.0f} from avg)</small>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # --- FIND NEARBY PLACES ---
-            st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
-            st.markdown("### 🍽️ Nearby Places to Meet")
-            
-            # Initialize session state for places
-            places_key = f"found_places_{result_key}"
-            if places_key not in st.session_state:
-                st.session_state[places_key] = None
-                st.session_state[f"{places_key}_category"] = None
-            
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                place_category = st.selectbox("What are you looking for?", 
-                    ["Restaurant", "Coffee", "Park", "Bar", "Cafe"], 
-                    key=f"place_search_{result_key}")
-            with col2:
-                if st.session_state[places_key]:
-                    if st.button("🔄 Reset", key=f"reset_places_{result_key}"):
-                        st.session_state[places_key] = None
-                        st.session_state[f"{places_key}_category"] = None
-                        st.rerun()
-            
-            if st.button("🔍 Find Nearby Places", key=f"find_places_{result_key}"):
-                with st.spinner(f"Finding {place_category.lower()}s near your meeting point..."):
-                    try:
-                        places = find_places_by_category(dataset, category_name=place_category)
-                        st.session_state[places_key] = places
-                        st.session_state[f"{places_key}_category"] = place_category
-                        st.rerun()
-                    except Exception as e:
-                        st.warning(f"Could not find nearby places. Make sure your LatLong API key is set in credentials.json")
-            
-            # Display stored places if they exist
-            if st.session_state[places_key]:
-                places = st.session_state[places_key]
-                category = st.session_state[f"{places_key}_category"]
-                
-                if places:
-                    # Count places with valid coordinates
-                    places_with_coords = [p for p in places if p.get('latitude') and p.get('longitude')]
-                    st.success(f"✅ Found {len(places)} {category.lower()}(s)! ({len(places_with_coords)} with map coordinates)")
-                    for i, place in enumerate(places, 1):
-                        full_text = place.get('name', 'Unknown')
-                        parts = full_text.split(',', 1)
-                        if len(parts) > 1:
-                            display_name = parts[0].strip()
-                            display_addr = parts[1].strip()
-                        else:
-                            display_name = full_text
-                            display_addr = "Location details in name"
-                        
-                        st.markdown(f"""
-                        <div class="member-card">
-                            <strong>#{i} {display_name}</strong><br>
-                            <small>📍 {display_addr}</small><br>
-                            <small style="color: #a0a0a0;">Near: {place.get('found_near', 'Meeting point')}</small>
-                        </div>
-                        """, unsafe_allow_html=True)
-                else:
-                    st.info(f"No {category.lower()}s found near your meeting point. Try a different category!")
+            _render_result_panel(selected_group, result_key, result)
+            _render_alternatives(result)
+            _render_travel_times(result)
+            _render_places_search(result_key, result)
     else:
         st.warning(f"Need at least 2 members with locations set. Currently have {len(member_data)} member(s) with locations.")
         st.info("Ask your group members to set their locations in their profiles!")
@@ -11,7 +11,6 @@ def render_groups():
     groups_repo = GroupsRepository()
     
     accounts = accounts_repo.load_all()
-    groups = groups_repo.load_all()
     
     st.markdown('<h1 class="hero-title">Your Groups 👥</h1>', unsafe_allow_html=True)
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
@@ -27,10 +26,7 @@ def render_groups():
             
             filtered_groups = user_groups
             if search_query:
-                filtered_groups = {
-                    name: data for name, data in user_groups.items()
-                    if search_query.lower() in name.lower() or search_query.lower() in data.get("vibe", "").lower()
-                }
+                filtered_groups = groups_repo.search(search_query, member_email=st.session_state.user_email)
             
             if filtered_groups:
                 for group_name, group_data in filtered_groups.items():
@@ -193,9 +189,10 @@ def render_groups():
                 st.warning("⚠️ Please enter a group name")
             elif groups_repo.exists(new_group_name):
                 st.error(f"❌ A group with the name '{new_group_name}' already exists!")
+            elif not groups_repo.create(new_group_name, [st.session_state.user_email] + selected_members,
+                                        new_group_vibe, st.session_state.user_email):
+                st.error(f"❌ A group with the name '{new_group_name}' already exists!")
             else:
-                all_members = [st.session_state.user_email] + selected_members
-                groups_repo.create(new_group_name, all_members, new_group_vibe, st.session_state.user_email)
                 st.success(f"✅ Group '{new_group_name}' created! 🎉")
                 st.balloons()
                 st.rerun()
@@ -206,18 +203,8 @@ def render_groups():
         # Search functionality
         search_query = st.text_input("🔍 Search groups", key="find_groups_search", placeholder="Search by name or vibe...")
         
-        if search_query:
-            available_groups = groups_repo.search(search_query)
-            # Filter out groups user is already in
-            available_groups = {
-                g: data for g, data in available_groups.items() 
-                if st.session_state.user_email not in data.get("members", [])
-            }
-        else:
-            available_groups = {
-                g: data for g, data in groups.items() 
-                if st.session_state.user_email not in data.get("members", [])
-            }
+        # Best matches among groups the user is not in yet (or the first groups without a query)
+        available_groups = groups_repo.search(search_query, exclude_member=st.session_state.user_email)
         
         if available_groups:
             st.markdown(f"**Found {len(available_groups)} group(s)**")
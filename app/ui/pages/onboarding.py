@@ -19,8 +19,7 @@ def render_onboarding():
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
     
     if st.session_state.onboarding_step == 1:
-        accounts = accounts_repo.load_all()
-        user = accounts.get(st.session_state.user_email, {})
+        user = accounts_repo.get(st.session_state.user_email) or {}
         
         st.markdown("### 📍 Where are you located?")
         st.markdown("*This helps us calculate fair meeting points for your groups*")
@@ -39,17 +38,13 @@ def render_onboarding():
         with col2:
             if st.button("Next →", key="onboard_next_1"):
                 if address.strip():
-                    accounts = accounts_repo.load_all()
-                    accounts[st.session_state.user_email]["address"] = address
                     coords = geocoding_service.get_coordinates(address)
                     if coords:
-                        accounts[st.session_state.user_email]["lat"] = coords[0]
-                        accounts[st.session_state.user_email]["lng"] = coords[1]
-                        accounts_repo.save_all(accounts)
+                        accounts_repo.update_location(st.session_state.user_email, address, coords[0], coords[1])
                         st.session_state.onboarding_step = 2
                         st.rerun()
                     else:
-                        accounts_repo.save_all(accounts)
+                        accounts_repo.update_location(st.session_state.user_email, address, None, None)
                         st.warning("Could not geocode address. You can update this later in your profile.")
                         st.session_state.onboarding_step = 2
                         st.rerun()
@@ -57,8 +52,7 @@ def render_onboarding():
                     st.warning("Please enter your address to continue")
     
     elif st.session_state.onboarding_step == 2:
-        accounts = accounts_repo.load_all()
-        user = accounts.get(st.session_state.user_email, {})
+        user = accounts_repo.get(st.session_state.user_email) or {}
         
         st.markdown("### 🚗 How do you usually travel?")
         st.markdown("*This helps us estimate travel times accurately*")
@@ -81,15 +75,12 @@ def render_onboarding():
                 st.rerun()
         with col2:
             if st.button("Next →", key="onboard_next_2"):
-                accounts = accounts_repo.load_all()
-                accounts[st.session_state.user_email]["transport_modes"] = selected_transport
-                accounts_repo.save_all(accounts)
+                accounts_repo.update(st.session_state.user_email, {"transport_modes": selected_transport})
                 st.session_state.onboarding_step = 3
                 st.rerun()
     
     elif st.session_state.onboarding_step == 3:
-        accounts = accounts_repo.load_all()
-        user = accounts.get(st.session_state.user_email, {})
+        user = accounts_repo.get(st.session_state.user_email) or {}
         
         st.markdown("### 🎂 A bit more about you")
         st.markdown("*Optional info to personalize your experience*")
@@ -109,9 +100,7 @@ def render_onboarding():
                 st.rerun()
         with col2:
             if st.button("Complete Setup ✨", key="onboard_complete"):
-                accounts = accounts_repo.load_all()
-                accounts[st.session_state.user_email]["age"] = int(age)
-                accounts_repo.save_all(accounts)
+                accounts_repo.update(st.session_state.user_email, {"age": int(age)})
                 st.session_state.onboarding_step = 0
                 st.session_state.current_page = "dashboard"
                 st.balloons()
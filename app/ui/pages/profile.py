@@ -10,8 +10,7 @@ def render_profile():
     accounts_repo = AccountsRepository()
     geocoding_service = GeocodingService()
     
-    accounts = accounts_repo.load_all()
-    user = accounts.get(st.session_state.user_email, {})
+    user = accounts_repo.get(st.session_state.user_email) or {}
     
     st.markdown('<h1 class="hero-title">Your Profile 👤</h1>', unsafe_allow_html=True)
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
@@ -35,10 +34,7 @@ def render_profile():
             if address.strip():
                 coords = geocoding_service.get_coordinates(address)
                 if coords:
-                    accounts[st.session_state.user_email]["lat"] = coords[0]
-                    accounts[st.session_state.user_email]["lng"] = coords[1]
-                    accounts[st.session_state.user_email]["address"] = address
-                    accounts_repo.save_all(accounts)
+                    accounts_repo.update_location(st.session_state.user_email, address, coords[0], coords[1])
                     st.success("Location updated!")
                     st.rerun()
                 else:
@@ -68,10 +64,11 @@ def render_profile():
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
     
     if st.button("💾 Save All Changes", use_container_width=True):
-        accounts[st.session_state.user_email]["name"] = name
-        accounts[st.session_state.user_email]["age"] = age
-        accounts[st.session_state.user_email]["address"] = address
-        accounts[st.session_state.user_email]["transport_modes"] = selected_transport
-        accounts_repo.save_all(accounts)
+        accounts_repo.update(st.session_state.user_email, {
+            "name": name,
+            "age": age,
+            "address": address,
+            "transport_modes": selected_transport
+        })
         st.success("Profile updated successfully! ✨")
 
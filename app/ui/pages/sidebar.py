@@ -11,8 +11,7 @@ def render_sidebar():
         st.markdown("## 🧭 Social Compass")
         st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
         
-        accounts = accounts_repo.load_all()
-        user = accounts.get(st.session_state.user_email, {})
+        user = accounts_repo.get(st.session_state.user_email) or {}
         st.markdown(f"### 👋 Hi, {user.get('name', 'Friend')}!")
         
         st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
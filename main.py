@@ -7,9 +7,11 @@ from datetime import datetime
 
 # Import data repositories
 from app.data import AccountsRepository, GroupsRepository, CredentialsManager
+from app.data.meeting_results import register_invalidation_hooks
 
 # Import services
 from app.services import OAuthService, GeocodingService
+from app.services.precompute import register_precompute_hooks
 
 # Import UI components
 from app.ui import CUSTOM_CSS
@@ -22,7 +24,8 @@ from app.ui.pages import (
     render_dashboard,
     render_profile,
     render_groups,
-    render_find_meeting
+    render_find_meeting,
+    cancel_meeting_optimization
 )
 
 # Configure page
@@ -53,6 +56,8 @@ if "repos_initialized" not in st.session_state:
     st.session_state.credentials = CredentialsManager()
     st.session_state.oauth_service = OAuthService()
     st.session_state.geocoding_service = GeocodingService()
+    register_precompute_hooks()
+    register_invalidation_hooks()
     st.session_state.repos_initialized = True
 
 # Use session state repositories
@@ -95,10 +100,10 @@ def handle_oauth_callback():
                 email = user_info.get("email")
                 name = user_info.get("name", email.split("@")[0])
                 
-                accounts = accounts_repo.load_all()
+                account = accounts_repo.get(email)
                 
-                if email not in accounts:
-                    accounts[email] = {
+                if account is None:
+                    accounts_repo.save(email, {
                         "name": name,
                         "email": email,
                         "oauth_provider": "google",
@@ -108,12 +113,10 @@ def handle_oauth_callback():
                         "lng": None,
                         "transport_modes": [],
                         "created_at": datetime.now().isoformat()
-                    }
-                    accounts_repo.save_all(accounts)
+                    })
                     st.session_state.onboarding_step = 1
                 else:
-                    accounts[email]["name"] = name
-                    accounts_repo.save_all(accounts)
+                    accounts_repo.update(email, {"name": name})
                 
                 st.session_state.authenticated = True
                 st.session_state.user_email = email
@@ -139,6 +142,10 @@ def main():
         else:
             render_sidebar()
             
+            # Leaving the find-meeting page abandons any optimization still in flight
+            if st.session_state.current_page != "find_meeting":
+                cancel_meeting_optimization()
+            
             if st.session_state.current_page == "dashboard":
                 render_dashboard()
             elif st.session_state.current_page == "profile":